@@ -15,6 +15,7 @@ load_dotenv()
 # Import your models here
 from models.subscribers import Subscribers
 from models.news import News
+from models.summary_cache import SummaryCache
 from db.db_connection import Base
 
 # this is the Alembic Config object, which provides
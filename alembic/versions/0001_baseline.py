@@ -0,0 +1,75 @@
+"""Baseline schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2024-10-20 09:00:00.000000
+
+Creates the subscribers and news tables as they stand after the link_hash and
+published_at migrations. Databases created earlier by init_db.py or the migrate_*
+scripts already have them, so existing tables are left untouched and this revision
+only records the starting point.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().as_sql:
+        # Offline (--sql) mode has no connection to inspect; emit the full schema
+        existing_tables = set()
+    else:
+        existing_tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "subscribers" not in existing_tables:
+        op.create_table(
+            "subscribers",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=255), nullable=True),
+            sa.Column("mobNumber", sa.Integer(), nullable=False),
+            sa.Column("state", sa.String(length=255), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_subscribers_id", "subscribers", ["id"])
+        op.create_index("ix_subscribers_mobNumber", "subscribers", ["mobNumber"], unique=True)
+
+    if "news" not in existing_tables:
+        op.create_table(
+            "news",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(length=500), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("link", sa.String(length=1000), nullable=True),
+            sa.Column("link_hash", sa.String(length=64), nullable=False),
+            sa.Column("pub_date", sa.String(length=255), nullable=True),
+            sa.Column("published_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("category", sa.String(length=100), nullable=True),
+            sa.Column("image", sa.String(length=1000), nullable=True),
+            sa.Column("publisher", sa.String(length=200), nullable=True),
+            sa.Column("tag", sa.String(length=100), nullable=False),
+            sa.Column("summary", sa.Text(), nullable=True),
+            sa.Column("is_summarized", sa.Boolean(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("tag", "link_hash", name="uq_news_tag_link_hash"),
+        )
+        op.create_index("ix_news_id", "news", ["id"])
+        op.create_index("ix_news_title", "news", ["title"])
+        op.create_index("ix_news_tag", "news", ["tag"])
+        op.create_index(
+            "ix_news_tag_published_at", "news",
+            ["tag", sa.text("published_at DESC"), sa.text("id DESC")],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("news")
+    op.drop_table("subscribers")
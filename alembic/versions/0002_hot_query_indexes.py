@@ -0,0 +1,51 @@
+"""Composite indexes for the hot list queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-10-20 09:30:00.000000
+
+Indexes are built CONCURRENTLY so they can be applied to a live table without blocking
+writes. CREATE INDEX CONCURRENTLY cannot run inside a transaction, hence autocommit_block.
+If a concurrent build fails it leaves an INVALID index behind; drop it and rerun.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Every list endpoint: WHERE tag = ? ORDER BY published_at DESC, id DESC
+        # (already present when migrate_published_at_column.py or 0001 created the table)
+        op.create_index(
+            "ix_news_tag_published_at", "news",
+            ["tag", sa.text("published_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Summarized list: the same order restricted to summarized rows, which stay a small share
+        op.create_index(
+            "ix_news_tag_published_at_summarized", "news",
+            ["tag", sa.text("published_at DESC"), sa.text("id DESC")],
+            postgresql_where=sa.text("is_summarized"),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        # Stats: latest ingested row per tag
+        op.create_index(
+            "ix_news_tag_created_at", "news",
+            ["tag", sa.text("created_at DESC")],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_news_tag_created_at", table_name="news",
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_news_tag_published_at_summarized", table_name="news",
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,33 @@
+"""Summary cache table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-10-27 09:00:00.000000
+
+Stores LLM summaries by a hash of the normalized input text and the model, so the same
+story arriving from several publishers or tags is only summarized once.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "summary_cache",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("summary_cache")
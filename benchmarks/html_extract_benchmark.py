@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+HTML-to-text extraction benchmark
+Checks that newsFeeds.html_text.html_to_text produces exactly the same output as
+BeautifulSoup(markup, "html.parser").get_text(separator="\\n") over a parity corpus,
+then measures the time per entry of both. It also checks that service.condense.condense() keeps
+every word of the extracted text when it fits the budget: html_to_text puts each inline run on
+its own line, and those lines must not be treated as paragraphs.
+
+The corpus is a set of hand-written edge cases plus synthetic feed entries shaped like the
+Nepali publishers' content:encoded HTML. Real entries can be added with --feed.
+
+Usage:
+    python benchmarks/html_extract_benchmark.py [--entries 300] [--repeat 5] [--feed saved_feed.xml ...]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from newsFeeds.html_text import html_to_text
+from service.condense import _BOILERPLATE, condense, estimate_tokens
+
+# Markup features that have tripped up text extractors before
+EDGE_CASES = [
+    "",
+    "   ",
+    " \n\t ",
+    "plain text without markup",
+    "<p>Hello <b>world</b></p>",
+    "<p>line one<br>line two<br/>line three</br>after</p>",
+    "<br>a</br>b",
+    "<div>\n  \n</div><p> </p><span>\t</span>",
+    "<pre>  keep   this\n  whitespace  </pre><p>  </p>",
+    "<textarea>   </textarea>",
+    "<p>Tom &amp; Jerry &nbsp; &lt;tag&gt; &copy; &foo; &amp bare</p>",
+    "<p>&#147;quoted&#148; &#x41;&#65; &#129; &#0; &#99999999;</p>",
+    "<script>var x = '<p>not text</p>';</script><p>visible</p>",
+    "<style>p { color: red; }</style><p>styled</p>",
+    "<template><p>hidden</p></template><p>shown</p>",
+    "<ruby>漢<rt>kan</rt><rp>(</rp>字<rp>)</rp></ruby>",
+    "<!-- comment --><p>after comment</p><!---->",
+    "<![CDATA[ character data ]]><![CDATA[]]>",
+    "<!DOCTYPE html><?xml version='1.0'?><p>declarations</p>",
+    "<ul><li>one<li>two<li>three</ul>",
+    "<table><tr><td>cell</td><td>cell 2</td></tr></table>",
+    "<div><pre>unclosed pre</div> after",
+    "<p>unterminated <b>bold",
+    "<p>stray </div> close</p>",
+    "text with < less than and > greater than",
+    "<a href=\"https://example.com/a.jpg\">link</a> https://example.com/b.jpeg",
+]
+
+# Article bodies with inline markup and repeated names, for the condense() check
+ARTICLE_CASES = [
+    "<p>The <strong>Prime Minister</strong> met the delegation on Monday. Later the <strong>Prime Minister</strong> "
+    "told reporters the <a href=\"https://example.com\">Prime Minister</a> would help.</p>",
+    "<p>प्रधानमन्त्री <strong>केपी ओली</strong> ले भने। <strong>केपी ओली</strong> ले थपे।</p>\n<p><b>काठमाडौं</b></p>\n<p><b>काठमाडौं</b></p>",
+    "<h2>Budget</h2>\n<p>The <em>budget</em> grew.</p>\n<h2>Budget</h2>\n<p>The <em>budget</em> grew again.</p>",
+    "<p>Copyright lawsuits against AI firms multiplied this year.</p>\n<p>Share on the market fell 3%.</p>"
+    "\n<p>Read more about the verdict, which upheld the ban.</p>",
+]
+
+NEPALI_WORDS = (
+    "काठमाडौं सरकार नेपाल प्रधानमन्त्री संसद निर्वाचन आयोग बजेट अर्थतन्त्र प्रदेश "
+    "जिल्ला प्रहरी विकास सडक विद्यालय स्वास्थ्य मन्त्रालय बैठक निर्णय समाचार"
+).split()
+ENGLISH_WORDS = (
+    "Kathmandu government Nepal minister parliament election commission budget economy "
+    "province district police development road school health ministry meeting decision"
+).split()
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(words) for _ in range(rng.randint(6, 18))) + "।"
+
+
+def synthetic_entry(rng):
+    """A content:encoded body in the style of the WordPress-based Nepali publishers"""
+    words = NEPALI_WORDS if rng.random() < 0.7 else ENGLISH_WORDS
+    image_id = rng.randint(1000, 99999)
+    parts = [
+        f'<figure class="wp-block-image"><img src="https://cdn.example.com/2024/10/{image_id}-150x150.jpg" '
+        f'alt="{_sentence(rng, words)}" width="1024" height="683" /></figure>\n',
+    ]
+    for _ in range(rng.randint(4, 14)):
+        kind = rng.random()
+        if kind < 0.65:
+            parts.append(f"<p>{_sentence(rng, words)} <strong>{_sentence(rng, words)}</strong> {_sentence(rng, words)}</p>\n")
+        elif kind < 0.75:
+            parts.append(f"<h2>{_sentence(rng, words)}</h2>\n")
+        elif kind < 0.85:
+            parts.append("<p>&nbsp;</p>\n<p>&#8220;" + _sentence(rng, words) + "&#8221; &amp; " + _sentence(rng, words) + "</p>\n")
+        elif kind < 0.92:
+            parts.append('<blockquote class="twitter-tweet"><p lang="ne">' + _sentence(rng, words)
+                         + '</p></blockquote><script async src="https://platform.twitter.com/widgets.js"></script>\n')
+        else:
+            parts.append("<!-- /wp:paragraph -->\n<ul><li>" + _sentence(rng, words) + "</li><li>"
+                         + _sentence(rng, words) + "</li></ul>\n")
+    parts.append(f'<p>The post <a href="https://example.com/{image_id}">{_sentence(rng, words)}</a> appeared first on Example.</p>')
+    return "".join(parts)
+
+
+def load_feed_entries(path):
+    import feedparser
+
+    feed = feedparser.parse(path)
+    return [entry.content[0].value for entry in feed.entries if entry.get('content')]
+
+
+def condense_word_loss(markup):
+    """Words of non-boilerplate text that condense() drops although the whole text fits its budget"""
+    text = html_to_text(markup)
+    expected = Counter()
+    for paragraph in re.split(r"\n\s*\n", text):
+        normalized = " ".join(paragraph.split())
+        if not _BOILERPLATE.match(normalized.casefold()):
+            expected.update(normalized.split())
+    # Per-paragraph estimates round up, so the budget gets headroom over the whole-text estimate
+    kept = Counter(condense(text, budget=2 * estimate_tokens(text) + 10).text.split())
+    return expected - kept
+
+
+def soup_text(markup):
+    return BeautifulSoup(markup, "html.parser").get_text(separator="\n")
+
+
+def time_per_entry(func, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for markup in corpus:
+            func(markup)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(corpus)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parity check and microbenchmark for html_to_text")
+    parser.add_argument("--entries", type=int, default=300, help="Number of synthetic feed entries")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions; the best run is reported")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--feed", action="append", default=[], help="Saved RSS file whose entries join the corpus")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = list(EDGE_CASES) + ARTICLE_CASES + [synthetic_entry(rng) for _ in range(args.entries)]
+    for path in args.feed:
+        corpus.extend(load_feed_entries(path))
+
+    print("HTML-to-text Extraction Benchmark")
+    print("=" * 40)
+
+    mismatches = [markup for markup in corpus if html_to_text(markup) != soup_text(markup)]
+    if mismatches:
+        print(f"✗ {len(mismatches)} of {len(corpus)} entries differ from BeautifulSoup, first one:")
+        print(repr(mismatches[0][:500]))
+        sys.exit(1)
+    print(f"✓ Parity: {len(corpus)} entries identical to BeautifulSoup.get_text")
+
+    losses = [(markup, lost) for markup in corpus if (lost := condense_word_loss(markup))]
+    if losses:
+        markup, lost = losses[0]
+        print(f"✗ condense() dropped words from {len(losses)} of {len(corpus)} entries, first one:")
+        print(repr(markup[:500]), dict(lost))
+        sys.exit(1)
+    print(f"✓ condense() kept every word of {len(corpus)} extracted entries")
+
+    # Time only the realistic entries; the edge cases are tiny and would flatter both
+    entries = corpus[len(EDGE_CASES) + len(ARTICLE_CASES):]
+    average_kb = sum(len(markup.encode("utf-8")) for markup in entries) / len(entries) / 1024
+    soup_time = time_per_entry(soup_text, entries, args.repeat)
+    fast_time = time_per_entry(html_to_text, entries, args.repeat)
+
+    print(f"Entries timed:    {len(entries)} (avg {average_kb:.1f} KB)")
+    print(f"BeautifulSoup:    {soup_time * 1e6:.1f} µs/entry")
+    print(f"html_to_text:     {fast_time * 1e6:.1f} µs/entry")
+    print(f"Speedup:          {soup_time / fast_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+LLM load benchmark
+Drives the LLM path against an OpenAI-compatible endpoint, by default the local stub
+(benchmarks/llm_stub_server.py) started in-process, so results are repeatable and need neither a
+real HF token nor network access.
+
+Modes:
+- pipeline: synthetic articles through summarizer.summarize_and_store, the same code ingest runs:
+  batching, SUMMARY_CONCURRENCY, the rate limit and retries. Runs once per --concurrency value,
+  so settings can be compared side by side. Articles live in an in-memory SQLite database and
+  the summary cache table is replaced by an empty one, so every article costs LLM calls.
+- endpoint: concurrent requests to a running app's /ai/summarize or /ai/summarize/stream; start
+  the app with LLM_BASE_URL pointing at the stub. Every request has unique text, so none is
+  answered from the summary cache.
+
+Usage:
+    python benchmarks/llm_load_benchmark.py pipeline [--articles 200] [--concurrency 1,4,8,16]
+                                                     [--batch-size 5] [--rate 0] [stub options]
+    python benchmarks/llm_load_benchmark.py endpoint --app-url http://127.0.0.1:8000
+                                                     [--requests 200] [--concurrency 20] [--stream]
+    Stub options are those of llm_stub_server.py; --base-url uses another endpoint instead.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import List
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCHMARK_DIR))
+sys.path.append(BENCHMARK_DIR)
+
+from llm_stub_server import add_stub_arguments, settings_from_args, start_stub
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+def _article(index: int) -> str:
+    return (f"Story {index}: officials announced a new policy on Monday after weeks of debate.\n\n"
+            f"The decision, number {index} this year, affects transport, schools and local budgets. "
+            "Critics said the consultation was rushed, while supporters pointed to rising costs.")
+
+
+def _print_latencies(latencies: List[float], label: str = "Latency"):
+    if latencies:
+        print(f"{label}: p50 {_percentile(latencies, 0.5) * 1000:.0f} ms, "
+              f"p95 {_percentile(latencies, 0.95) * 1000:.0f} ms, max {max(latencies) * 1000:.0f} ms")
+
+
+def _scratch_session():
+    """Session on an in-memory SQLite database holding only the news table"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from models.news import News
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    News.__table__.create(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _disable_summary_cache():
+    """Every summary goes to the LLM: the cache table is replaced by an always-empty one"""
+    from service import summary_cache
+
+    summary_cache._load_stored = lambda keys: {}
+    summary_cache._store = lambda key, model, summary: None
+
+
+def _record_latencies(latencies: List[float]):
+    """Time each LLM call the summarizer makes, batch and single alike"""
+    from service import summarizer, summary_cache
+
+    def timed(call):
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+        return wrapper
+
+    summarizer.asummarize_news_batch = timed(summarizer.asummarize_news_batch)
+    summary_cache.asummarize_news = timed(summary_cache.asummarize_news)
+
+
+def run_pipeline(args) -> List[dict]:
+    from datetime import datetime, timezone
+
+    from models.news import News
+    from service import summarizer
+
+    _disable_summary_cache()
+    latencies: List[float] = []
+    _record_latencies(latencies)
+    db = _scratch_session()
+
+    summarizer.SUMMARY_BATCH_SIZE = args.batch_size
+    summarizer.SUMMARY_RATE_PER_SEC = args.rate
+    results = []
+    for offset, concurrency in enumerate(int(c) for c in args.concurrency.split(",")):
+        summarizer.SUMMARY_CONCURRENCY = concurrency
+        summarizer.SUMMARY_BURST = concurrency
+        # Fresh text per run, so no run profits from an earlier one
+        first = offset * args.articles
+        news_items = [
+            News(title=f"Story {index}", description=None, content=_article(index), link_hash=f"{index:064d}",
+                 tag="benchmark", published_at=datetime.now(timezone.utc))
+            for index in range(first, first + args.articles)
+        ]
+        db.add_all(news_items)
+        db.commit()
+        latencies.clear()
+
+        start = time.perf_counter()
+        summarized = summarizer.summarize_and_store(news_items, db, label="benchmark")
+        elapsed = time.perf_counter() - start
+        throughput = summarized / elapsed if elapsed else 0.0
+        print(f"\nConcurrency {concurrency}")
+        print(f"Summarized: {summarized}/{args.articles} in {elapsed:.2f}s "
+              f"({throughput:.1f} articles/s, {len(latencies)} requests)")
+        _print_latencies(latencies, "Request latency")
+        results.append({
+            "concurrency": concurrency,
+            "articles": args.articles,
+            "summarized": summarized,
+            "requests": len(latencies),
+            "elapsed_s": round(elapsed, 3),
+            "articles_per_s": round(throughput, 2),
+            "p50_ms": round(_percentile(latencies, 0.5) * 1000, 1),
+            "p95_ms": round(_percentile(latencies, 0.95) * 1000, 1),
+        })
+    db.close()
+    return results
+
+
+async def _endpoint_run(args) -> dict:
+    import httpx
+
+    path = "/ai/summarize/stream" if args.stream else "/ai/summarize"
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: List[float] = []
+    first_bytes: List[float] = []
+    failures = 0
+    run_id = int(time.time())
+
+    async def one(client: "httpx.AsyncClient", index: int):
+        nonlocal failures
+        body = {"news_content": f"[{run_id}] " + _article(index)}
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with client.stream("POST", path, json=body) as response:
+                    first = None
+                    async for _ in response.aiter_raw():
+                        first = first or time.perf_counter()
+                    if response.status_code != 200:
+                        failures += 1
+                        return
+                latencies.append(time.perf_counter() - start)
+                first_bytes.append((first or time.perf_counter()) - start)
+            except httpx.HTTPError as e:
+                failures += 1
+                print(f"✗ Request {index}: {e}")
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    start = time.perf_counter()
+    async with httpx.AsyncClient(base_url=args.app_url, limits=limits, timeout=120) as client:
+        await asyncio.gather(*(one(client, index) for index in range(args.requests)))
+    return {"elapsed": time.perf_counter() - start, "latencies": latencies,
+            "first_bytes": first_bytes, "failures": failures}
+
+
+def run_endpoint(args) -> List[dict]:
+    run = asyncio.run(_endpoint_run(args))
+    throughput = len(run["latencies"]) / run["elapsed"] if run["elapsed"] else 0.0
+    print(f"\n{'POST /ai/summarize/stream' if args.stream else 'POST /ai/summarize'}, "
+          f"concurrency {args.concurrency}")
+    print(f"Completed: {len(run['latencies'])}/{args.requests} in {run['elapsed']:.2f}s "
+          f"({throughput:.1f} req/s, {run['failures']} failed)")
+    _print_latencies(run["latencies"])
+    if args.stream:
+        _print_latencies(run["first_bytes"], "First byte")
+    return [{
+        "stream": args.stream,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "completed": len(run["latencies"]),
+        "failed": run["failures"],
+        "elapsed_s": round(run["elapsed"], 3),
+        "requests_per_s": round(throughput, 2),
+        "p50_ms": round(_percentile(run["latencies"], 0.5) * 1000, 1),
+        "p95_ms": round(_percentile(run["latencies"], 0.95) * 1000, 1),
+        "first_byte_p50_ms": round(_percentile(run["first_bytes"], 0.5) * 1000, 1) if args.stream else None,
+    }]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the LLM path against an OpenAI-compatible stub")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    pipeline = modes.add_parser("pipeline", help="Ingest summarization pool")
+    pipeline.add_argument("--articles", type=int, default=200, help="Articles per run")
+    pipeline.add_argument("--concurrency", default="1,4,8,16", help="Comma-separated SUMMARY_CONCURRENCY values")
+    pipeline.add_argument("--batch-size", type=int, default=5, help="SUMMARY_BATCH_SIZE (1 disables batching)")
+    pipeline.add_argument("--rate", type=float, default=0, help="SUMMARY_RATE_PER_SEC (0 disables the limit)")
+    pipeline.add_argument("--base-url", help="Use this endpoint instead of starting the stub")
+    add_stub_arguments(pipeline)
+
+    endpoint = modes.add_parser("endpoint", help="A running app's summarize endpoint")
+    endpoint.add_argument("--app-url", default="http://127.0.0.1:8000", help="Base URL of the running app")
+    endpoint.add_argument("--requests", type=int, default=200)
+    endpoint.add_argument("--concurrency", type=int, default=20)
+    endpoint.add_argument("--stream", action="store_true", help="Use /ai/summarize/stream")
+
+    parser.add_argument("--history", help="Append the results as JSON lines to this file")
+    args = parser.parse_args()
+
+    print("LLM Load Benchmark")
+    print("=" * 40)
+
+    if args.mode == "pipeline":
+        stub = None
+        if not args.base_url:
+            settings = settings_from_args(args)
+            stub = start_stub(settings)
+            args.base_url = f"http://127.0.0.1:{stub.server_port}/v1"
+            print(f"Stub:   {args.base_url} (latency {args.latency}s ±{args.jitter}s, "
+                  f"{args.tokens_per_sec:g} tokens/s, error rate {args.error_rate:g})")
+        # Read by service.llm_service at import
+        os.environ["LLM_BASE_URL"] = args.base_url
+        os.environ.setdefault("HF_TOKEN", "stub")
+        try:
+            results = run_pipeline(args)
+        finally:
+            if stub is not None:
+                stub.shutdown()
+                print(f"\n📊 Stub served {settings.requests} requests, {settings.errors} injected failures")
+    else:
+        results = run_endpoint(args)
+
+    if args.history:
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        with open(args.history, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps({"timestamp": timestamp, "mode": args.mode, **result}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+OpenAI-compatible LLM stub server
+Answers POST /v1/chat/completions (plain and stream=True) and GET /v1/models like the HF router,
+with tunable timing and failures, so the LLM path can be measured offline and repeatably:
+
+- time to first token: --latency seconds, +/- --jitter, overridable per model with
+  --model-latency model=seconds (e.g. a slow primary to exercise hedging);
+- generation speed: --reply-tokens tokens at --tokens-per-sec;
+- failures: --error-rate of requests answer --error-status after the first-token latency.
+
+Batch summary prompts (<article id="N"> blocks) get the JSON shape service/llm_service.py parses,
+so batching is exercised too. Any API key is accepted.
+
+Point the app at it with:
+    LLM_BASE_URL=http://127.0.0.1:8800/v1 HF_TOKEN=stub uvicorn news_app:app
+
+Usage:
+    python benchmarks/llm_stub_server.py [--port 8800] [--latency 0.5] [--jitter 0.2] [--tokens-per-sec 50]
+                                         [--reply-tokens 60] [--error-rate 0] [--error-status 503]
+                                         [--model-latency model=seconds ...] [--seed 1]
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+_ARTICLE_ID = re.compile(r'<article id="(\d+)">')
+
+_WORDS = ("breaking", "officials", "said", "the", "new", "report", "shows", "a", "major", "shift",
+          "in", "policy", "that", "could", "affect", "millions", "but", "the", "real", "story", "is",
+          "what", "happens", "next")
+
+
+class StubSettings:
+    """
+    Behaviour of the stub
+
+    Args:
+        latency (float): Mean seconds before the first token
+        jitter (float): Latency varies uniformly by up to this many seconds either way
+        tokens_per_sec (float): Generation speed after the first token; 0 sends everything at once
+        reply_tokens (int): Words per answer (per article for batch prompts)
+        error_rate (float): Fraction of requests that fail
+        error_status (int): HTTP status of failed requests
+        model_latency (dict): Mean first-token latency per model, overriding latency
+        seed (int): Seed for latency, failures and reply text, for repeatable runs
+    """
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.0, tokens_per_sec: float = 50,
+                 reply_tokens: int = 60, error_rate: float = 0.0, error_status: int = 503,
+                 model_latency: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.tokens_per_sec = tokens_per_sec
+        self.reply_tokens = reply_tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.model_latency = model_latency or {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def plan(self, model: str):
+        """(first-token delay, fail?) for one request"""
+        with self._lock:
+            self.requests += 1
+            base = self.model_latency.get(model, self.latency)
+            delay = max(base + self._random.uniform(-self.jitter, self.jitter), 0)
+            fail = self._random.random() < self.error_rate
+            self.errors += 1 if fail else 0
+            return delay, fail
+
+    def words(self, count: int):
+        with self._lock:
+            return [self._random.choice(_WORDS) for _ in range(count)]
+
+
+def _reply_tokens(settings: StubSettings, messages) -> list:
+    """Answer as a list of tokens; batch summary prompts get one JSON summary per article"""
+    prompt = messages[-1].get("content", "") if messages else ""
+    article_ids = _ARTICLE_ID.findall(prompt or "")
+    if not article_ids:
+        return [word + " " for word in settings.words(settings.reply_tokens)]
+    summaries = [{"id": int(article_id), "summary": " ".join(settings.words(settings.reply_tokens))}
+                 for article_id in article_ids]
+    text = json.dumps({"summaries": summaries})
+    # Roughly one token per word of the JSON text
+    return re.findall(r"\S+\s*", text)
+
+
+def make_handler(settings: StubSettings):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send_json(self, status: int, payload: Dict):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                models = sorted(set(settings.model_latency) | {"stub"})
+                self._send_json(200, {"object": "list", "data": [{"id": m, "object": "model"} for m in models]})
+            else:
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+            try:
+                request = json.loads(body)
+            except ValueError:
+                self._send_json(400, {"error": {"message": "invalid JSON body"}})
+                return
+
+            model = request.get("model", "stub")
+            delay, fail = settings.plan(model)
+            time.sleep(delay)
+            if fail:
+                self._send_json(settings.error_status, {"error": {"message": "stub: injected failure",
+                                                                  "type": "server_error"}})
+                return
+
+            tokens = _reply_tokens(settings, request.get("messages", []))
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+            usage = {"prompt_tokens": len(body) // 4, "completion_tokens": len(tokens),
+                     "total_tokens": len(body) // 4 + len(tokens)}
+            gap = 1 / settings.tokens_per_sec if settings.tokens_per_sec > 0 else 0
+            if request.get("stream"):
+                self._stream(completion_id, model, tokens, gap)
+                return
+            time.sleep(gap * max(len(tokens) - 1, 0))
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "".join(tokens).strip()}}],
+                "usage": usage,
+            })
+
+        def _stream(self, completion_id: str, model: str, tokens: list, gap: float):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            def send(data: str):
+                event = f"data: {data}\n\n".encode("utf-8")
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+                self.wfile.flush()
+
+            try:
+                for index, token in enumerate(tokens):
+                    if index:
+                        time.sleep(gap)
+                    send(json.dumps({
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                    }))
+                send("[DONE]")
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                # The client closed the stream, e.g. a hedged request that lost
+                self.close_connection = True
+
+    return StubHandler
+
+
+def start_stub(settings: StubSettings, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Serve the stub on a background thread
+
+    Returns:
+        ThreadingHTTPServer; its base URL is f"http://{host}:{server.server_port}/v1"
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(settings))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _model_latency(values) -> Dict[str, float]:
+    latencies = {}
+    for value in values or []:
+        model, _, seconds = value.rpartition("=")
+        if not model:
+            raise argparse.ArgumentTypeError(f"expected model=seconds, got {value!r}")
+        latencies[model] = float(seconds)
+    return latencies
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.5, help="Mean seconds before the first token")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Uniform latency jitter in seconds")
+    parser.add_argument("--tokens-per-sec", type=float, default=50, help="Generation speed; 0 for instant")
+    parser.add_argument("--reply-tokens", type=int, default=60, help="Words per answer")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of failed requests")
+    parser.add_argument("--model-latency", action="append", metavar="MODEL=SECONDS",
+                        help="Mean first-token latency for one model (repeatable)")
+    parser.add_argument("--seed", type=int, help="Random seed for repeatable runs")
+
+
+def settings_from_args(args) -> StubSettings:
+    return StubSettings(
+        latency=args.latency, jitter=args.jitter, tokens_per_sec=args.tokens_per_sec,
+        reply_tokens=args.reply_tokens, error_rate=args.error_rate, error_status=args.error_status,
+        model_latency=_model_latency(args.model_latency), seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible chat-completions stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    settings = settings_from_args(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(settings))
+    server.daemon_threads = True
+    print(f"🤖 LLM stub on http://{args.host}:{args.port}/v1 (latency {args.latency}s ±{args.jitter}s, "
+          f"{args.tokens_per_sec:g} tokens/s, error rate {args.error_rate:g})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 Served {settings.requests} requests, {settings.errors} injected failures")
+
+
+if __name__ == "__main__":
+    main()
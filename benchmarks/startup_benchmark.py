@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark
+Measures how long `import news_app` takes in a fresh interpreter and checks it against a budget.
+It also fails when importing the app pulls in heavy dependencies that should load lazily,
+or when the import tries to open a network connection.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 7] [--budget-ms 1500] [--history startup_history.jsonl]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported when first used
+LAZY_MODULES = ("openai", "bs4", "feedparser", "httpx")
+
+DEFAULT_BUDGET_MS = float(os.getenv("STARTUP_BUDGET_MS", "1500"))
+
+# Runs in the child interpreter: any socket connect during import counts as a violation
+_PROBE = """
+import json, socket, sys, time
+connects = []
+_connect = socket.socket.connect
+def _record(self, address):
+    connects.append(str(address))
+    return _connect(self, address)
+socket.socket.connect = _record
+start = time.perf_counter()
+import news_app
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed_ms": elapsed * 1000,
+    "lazy_modules_loaded": [m for m in %r if m in sys.modules],
+    "network_connects": connects,
+}))
+""" % (LAZY_MODULES,)
+
+
+def measure_once():
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import news_app failed:\n{completed.stderr}")
+    # The probe prints its JSON last; anything before it is output produced during import
+    lines = completed.stdout.strip().splitlines()
+    result = json.loads(lines[-1])
+    result["stdout_lines"] = len(lines) - 1
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark `import news_app` against a time budget")
+    parser.add_argument("--runs", type=int, default=7, help="Number of fresh interpreters to measure")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Budget for the median import time")
+    parser.add_argument("--history", help="Append the result as a JSON line to this file")
+    args = parser.parse_args()
+
+    print("news_app Startup Benchmark")
+    print("=" * 40)
+
+    runs = [measure_once() for _ in range(args.runs)]
+    timings = [run["elapsed_ms"] for run in runs]
+    median_ms = statistics.median(timings)
+
+    print(f"Runs:   {args.runs}")
+    print(f"Min:    {min(timings):.1f} ms")
+    print(f"Median: {median_ms:.1f} ms")
+    print(f"Max:    {max(timings):.1f} ms")
+    print(f"Budget: {args.budget_ms:.1f} ms")
+
+    failures = []
+    if median_ms > args.budget_ms:
+        failures.append(f"median import time {median_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+    lazy_loaded = sorted({m for run in runs for m in run["lazy_modules_loaded"]})
+    if lazy_loaded:
+        failures.append(f"heavy modules imported eagerly: {', '.join(lazy_loaded)}")
+    connects = sorted({c for run in runs for c in run["network_connects"]})
+    if connects:
+        failures.append(f"network connections opened during import: {', '.join(connects)}")
+    if any(run["stdout_lines"] for run in runs):
+        failures.append("import wrote to stdout")
+
+    if args.history:
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "runs": args.runs,
+            "min_ms": round(min(timings), 1),
+            "median_ms": round(median_ms, 1),
+            "max_ms": round(max(timings), 1),
+            "budget_ms": args.budget_ms,
+            "passed": not failures,
+        }
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print("✓ Startup within budget with no import-time side effects")
+
+
+if __name__ == "__main__":
+    main()
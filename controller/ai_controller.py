@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional
 
-from service.llm_service import chat_completion, ask_plaintext, summarize_news, detect_language
+from service.llm_service import (
+    DEFAULT_MODEL, achat_completion, aask_plaintext, astream_chat_completion, astream_summary, detect_language,
+)
+from service.streaming import single_chunk, stream_response
+from service.summary_cache import aget_cached_summary, asummarize_cached, astore_summary
 
 
 class SummarizeRequest(BaseModel):
@@ -17,18 +21,18 @@ router = APIRouter(
 
 
 @router.get("/ask")
-def ask_ai(q: str = Query(..., description="Prompt to send to the model"), model: Optional[str] = None):
+async def ask_ai(q: str = Query(..., description="Prompt to send to the model"), model: Optional[str] = None):
     try:
-        content = ask_plaintext(q, model=model or "openai/gpt-oss-20b:fireworks-ai")
+        content = await aask_plaintext(q, model=model or DEFAULT_MODEL)
         return {"status": "success", "data": {"answer": content}}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/chat")
-def chat(messages: list[dict], model: Optional[str] = None):
+async def chat(messages: list[dict], model: Optional[str] = None):
     try:
-        result = chat_completion(messages=messages, model=model or "openai/gpt-oss-20b:fireworks-ai")
+        result = await achat_completion(messages=messages, model=model or DEFAULT_MODEL)
         message = result.get("message")
         content = message.get("content", "") if isinstance(message, dict) else ""
         return {
@@ -48,18 +52,18 @@ def chat(messages: list[dict], model: Optional[str] = None):
 
 
 @router.post("/summarize")
-def summarize_news_endpoint_post(request: SummarizeRequest):
+async def summarize_news_endpoint_post(request: SummarizeRequest):
     """Generate a 60-word news summary using the professional news summarizer."""
     try:
         detected_lang = detect_language(request.news_content)
-        summary = summarize_news(request.news_content, model=request.model or "openai/gpt-oss-20b:fireworks-ai")
+        summary = await asummarize_cached(request.news_content, model=request.model or DEFAULT_MODEL)
         return {
             "status": "success",
             "data": {
                 "summary": summary,
                 "word_count": len(summary.split()),
                 "detected_language": detected_lang,
-                "model": request.model or "openai/gpt-oss-20b:fireworks-ai"
+                "model": request.model or DEFAULT_MODEL
             }
         }
     except Exception as e:
@@ -67,7 +71,7 @@ def summarize_news_endpoint_post(request: SummarizeRequest):
 
 
 @router.get("/summarize")
-def summarize_news_endpoint_get(
+async def summarize_news_endpoint_get(
     news_content: str = Query(..., description="News content to summarize"), 
     model: Optional[str] = Query(None, description="Model to use for summarization")
 ):
@@ -77,17 +81,76 @@ def summarize_news_endpoint_get(
             raise HTTPException(status_code=400, detail="news_content cannot be empty")
             
         detected_lang = detect_language(news_content)
-        summary = summarize_news(news_content, model=model or "openai/gpt-oss-20b:fireworks-ai")
+        summary = await asummarize_cached(news_content, model=model or DEFAULT_MODEL)
         return {
             "status": "success",
             "data": {
                 "summary": summary,
                 "word_count": len(summary.split()),
                 "detected_language": detected_lang,
-                "model": model or "openai/gpt-oss-20b:fireworks-ai"
+                "model": model or DEFAULT_MODEL
             }
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _summary_stream(news_content: str, model: str, stream_format: str):
+    detected_lang = detect_language(news_content)
+    cached = await aget_cached_summary(news_content, model)
+    if cached is not None:
+        tokens, on_complete = single_chunk(cached), None
+    else:
+        tokens = astream_summary(news_content, model=model)
+
+        def on_complete(summary: str):
+            return astore_summary(news_content, model, summary)
+
+    return await stream_response(
+        tokens,
+        lambda summary: {
+            "word_count": len(summary.split()),
+            "detected_language": detected_lang,
+            "model": model,
+        },
+        stream_format,
+        on_complete,
+    )
+
+
+@router.post("/summarize/stream")
+async def summarize_news_stream_post(
+    request: SummarizeRequest,
+    stream_format: str = Query("sse", alias="format", description="sse or ndjson")
+):
+    """Stream the 60-word summary as it is generated; word count and language arrive in the done event."""
+    if not request.news_content.strip():
+        raise HTTPException(status_code=400, detail="news_content cannot be empty")
+    return await _summary_stream(request.news_content, request.model or DEFAULT_MODEL, stream_format)
+
+
+@router.get("/summarize/stream")
+async def summarize_news_stream_get(
+    news_content: str = Query(..., description="News content to summarize"),
+    model: Optional[str] = Query(None, description="Model to use for summarization"),
+    stream_format: str = Query("sse", alias="format", description="sse or ndjson")
+):
+    """Stream the 60-word summary as it is generated; word count and language arrive in the done event."""
+    if not news_content.strip():
+        raise HTTPException(status_code=400, detail="news_content cannot be empty")
+    return await _summary_stream(news_content, model or DEFAULT_MODEL, stream_format)
+
+
+@router.get("/ask/stream")
+async def ask_ai_stream(
+    q: str = Query(..., description="Prompt to send to the model"),
+    model: Optional[str] = None,
+    stream_format: str = Query("sse", alias="format", description="sse or ndjson")
+):
+    """Stream the answer as it is generated."""
+    model = model or DEFAULT_MODEL
+    return await stream_response(
+        astream_chat_completion(messages=[{"role": "user", "content": q}], model=model),
+        lambda answer: {"word_count": len(answer.split()), "model": model},
+        stream_format,
+    )
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any
-from db.db_connection import get_db
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Any, Optional
+from db.db_connection import get_async_db
 from models.news import News, NewsResponse
 from service.international_news_service import InternationalNewsService, process_international_news
-from sqlalchemy import and_
+from service.http_cache import is_not_modified, make_etag, not_modified_response, set_cache_headers
+from service.pagination import MAX_PAGE_SIZE, list_last_modified, list_version, next_page, paginate, set_next_cursor
+from sqlalchemy import and_, func, select
 
 router = APIRouter(
     prefix="/international-news",
@@ -38,7 +42,8 @@ async def process_international_news_sync():
     This endpoint waits for the processing to complete
     """
     try:
-        result = process_international_news()
+        # Fetching, saving and summarizing block; a worker thread keeps the event loop serving
+        result = await asyncio.to_thread(process_international_news)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing news: {str(e)}")
@@ -46,45 +51,66 @@ async def process_international_news_sync():
 
 @router.get("/", response_model=List[NewsResponse])
 async def get_international_news(
-    limit: int = 50,
-    offset: int = 0,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get international news from database
+    Get international news from database, newest first
+    Pass the X-Next-Cursor response header back as cursor to get the next page
     """
     try:
-        news_items = db.query(News).filter(
-            News.tag == "international_news"
-        ).order_by(
-            News.pub_date.desc()
-        ).offset(offset).limit(limit).all()
+        criteria = (News.tag == "international_news",)
+        version = (await db.execute(list_version(*criteria))).one()
+        etag = make_etag("international_news", *version, limit, offset, cursor)
+        last_modified = list_last_modified("international_news", version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        set_cache_headers(response, etag, last_modified)
+
+        query = select(News).filter(*criteria)
+        news_items, next_cursor = next_page((await db.scalars(paginate(query, limit, offset, cursor))).all(), limit)
+        set_next_cursor(response, next_cursor)
         
         return news_items
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching news: {str(e)}")
 
 
 @router.get("/summarized", response_model=List[NewsResponse])
 async def get_summarized_international_news(
-    limit: int = 50,
-    offset: int = 0,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get only summarized international news from database
+    Get only summarized international news from database, newest first
+    Pass the X-Next-Cursor response header back as cursor to get the next page
     """
     try:
-        news_items = db.query(News).filter(
-            and_(
-                News.tag == "international_news",
-                News.is_summarized == True
-            )
-        ).order_by(
-            News.created_at.desc()
-        ).offset(offset).limit(limit).all()
+        criteria = (News.tag == "international_news", News.is_summarized == True)
+        version = (await db.execute(list_version(*criteria))).one()
+        etag = make_etag("international_news:summarized", *version, limit, offset, cursor)
+        last_modified = list_last_modified("international_news:summarized", version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        set_cache_headers(response, etag, last_modified)
+
+        query = select(News).filter(*criteria)
+        news_items, next_cursor = next_page((await db.scalars(paginate(query, limit, offset, cursor))).all(), limit)
+        set_next_cursor(response, next_cursor)
         
         return news_items
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching summarized news: {str(e)}")
 
@@ -92,18 +118,18 @@ async def get_summarized_international_news(
 @router.get("/{news_id}", response_model=NewsResponse)
 async def get_international_news_by_id(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific international news item by ID
     """
     try:
-        news_item = db.query(News).filter(
+        news_item = await db.scalar(select(News).filter(
             and_(
                 News.id == news_id,
                 News.tag == "international_news"
             )
-        ).first()
+        ))
         
         if not news_item:
             raise HTTPException(status_code=404, detail="News item not found")
@@ -118,24 +144,24 @@ async def get_international_news_by_id(
 @router.delete("/{news_id}")
 async def delete_international_news(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a specific international news item by ID
     """
     try:
-        news_item = db.query(News).filter(
+        news_item = await db.scalar(select(News).filter(
             and_(
                 News.id == news_id,
                 News.tag == "international_news"
             )
-        ).first()
+        ))
         
         if not news_item:
             raise HTTPException(status_code=404, detail="News item not found")
         
-        db.delete(news_item)
-        db.commit()
+        await db.delete(news_item)
+        await db.commit()
         
         return {"message": "News item deleted successfully"}
     except HTTPException:
@@ -147,18 +173,18 @@ async def delete_international_news(
 @router.post("/summarize/{news_id}")
 async def summarize_specific_news(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Manually trigger summarization for a specific news item
     """
     try:
-        news_item = db.query(News).filter(
+        news_item = await db.scalar(select(News).filter(
             and_(
                 News.id == news_id,
                 News.tag == "international_news"
             )
-        ).first()
+        ))
         
         if not news_item:
             raise HTTPException(status_code=404, detail="News item not found")
@@ -176,18 +202,18 @@ async def summarize_specific_news(
         if not content_to_summarize.strip():
             raise HTTPException(status_code=400, detail="No content available to summarize")
         
-        # Generate summary
-        from service.llm_service import summarize_news
+        # Generate summary on the shared async LLM client; the cache lookups run off the event loop
+        from service.summary_cache import asummarize_cached
         from datetime import datetime
         
-        summary = summarize_news(content_to_summarize)
+        summary = await asummarize_cached(content_to_summarize)
         
         # Update the news item
         news_item.summary = summary
         news_item.is_summarized = True
         news_item.updated_at = datetime.utcnow()
         
-        db.commit()
+        await db.commit()
         
         return {
             "message": "News item summarized successfully",
@@ -201,18 +227,18 @@ async def summarize_specific_news(
 
 
 @router.get("/stats/summary")
-async def get_international_news_stats(db: Session = Depends(get_db)):
+async def get_international_news_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Get statistics about international news in the database
     """
     try:
-        total_news = db.query(News).filter(News.tag == "international_news").count()
-        summarized_news = db.query(News).filter(
+        total_news = await db.scalar(select(func.count()).select_from(News).filter(News.tag == "international_news"))
+        summarized_news = await db.scalar(select(func.count()).select_from(News).filter(
             and_(
                 News.tag == "international_news",
                 News.is_summarized == True
             )
-        ).count()
+        ))
         
         return {
             "total_news": total_news,
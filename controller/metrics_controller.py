@@ -0,0 +1,32 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from db.pool_metrics import POOL_METRICS, render_prometheus
+from service import llm_metrics
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+)
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(render_prometheus() + llm_metrics.render_prometheus(),
+                             media_type="text/plain; version=0.0.4")
+
+
+@router.get("/pool")
+def get_pool_metrics():
+    """Connection pool gauges and latency histograms as JSON"""
+    return {name: metrics.as_dict() for name, metrics in POOL_METRICS.items()}
+
+
+@router.get("/llm")
+def get_llm_metrics():
+    """Summary input condensation and per-model latency, failure and hedging stats as JSON"""
+    return {
+        "condense": llm_metrics.CONDENSE_METRICS.as_dict(),
+        "models": {model: stats.as_dict() for model, stats in list(llm_metrics.MODEL_STATS.items())},
+    }
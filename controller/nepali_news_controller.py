@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import Optional
 from service.nepali_news_service import process_nepali_news
 from db.db_connection import get_db
 from models.news import News
+from service import fast_json
+from service.fast_json import JSON_MEDIA_TYPE
+from service.http_cache import cache_headers, is_not_modified, make_etag, not_modified_response
+from service.pagination import MAX_PAGE_SIZE, list_last_modified, list_version, next_page, paginate
+from service.ttl_cache import TTLCache
 from sqlalchemy.orm import Session
 
 router = APIRouter(
@@ -23,95 +28,75 @@ def process_nepali_news_endpoint():
         raise HTTPException(status_code=500, detail=f"Error processing Nepali news: {str(e)}")
 
 
+# Fields of each row in the list response
+_NEWS_FIELDS = (
+    "id", "title", "description", "content", "link", "pub_date", "published_at", "category", "image",
+    "publisher", "tag", "summary", "is_summarized", "created_at", "updated_at",
+)
+
+# Encoded pages keyed by their ETag, which already includes the list version, so an entry is never
+# out of date; the TTL only bounds how long pages nobody asks for stay in memory
+_page_bodies = TTLCache(maxsize=64, ttl=300, stale_ttl=0, name="nepali news pages")
+
+
+def _encode_page(db: Session, criteria, scope: str, limit: int, cursor: Optional[str]) -> bytes:
+    query = db.query(News).filter(*criteria)
+    news_items, next_cursor = next_page(paginate(query, limit, cursor=cursor).all(), limit)
+
+    result = {
+        "status": "success",
+        "data": [{field: getattr(item, field) for field in _NEWS_FIELDS} for item in news_items],
+        "count": len(news_items),
+    }
+    if scope != 'all':
+        result["language"] = scope
+    result["next_cursor"] = next_cursor
+    return fast_json.dumps(result)
+
+
 @router.get("/", status_code=200)
-def get_nepali_news(language: Optional[str] = None, limit: Optional[int] = 50):
+def get_nepali_news(request: Request, language: Optional[str] = None,
+                    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+                    cursor: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Get Nepali news from database
     language: 'np' for Nepali, 'en' for English, None for all
     limit: maximum number of news items to return
+    cursor: next_cursor from the previous page
     """
     try:
-        db = next(get_db())
-        
-        # Determine tag based on language
-        if language == 'np':
-            tag = "nepaliNewsNp"
-        elif language == 'en':
-            tag = "nepaliNewsEn"
+        # Determine tag based on language; any other value means all, and shares its cache entries
+        scope = language if language in ('np', 'en') else 'all'
+        if scope == 'np':
+            criteria = (News.tag == "nepaliNewsNp",)
+        elif scope == 'en':
+            criteria = (News.tag == "nepaliNewsEn",)
         else:
             # Return all Nepali news (both languages)
-            news_items = db.query(News).filter(
-                News.tag.in_(["nepaliNewsNp", "nepaliNewsEn"])
-            ).order_by(News.created_at.desc()).limit(limit).all()
-            
-            return {
-                "status": "success",
-                "data": [
-                    {
-                        "id": item.id,
-                        "title": item.title,
-                        "description": item.description,
-                        "content": item.content,
-                        "link": item.link,
-                        "pub_date": item.pub_date,
-                        "category": item.category,
-                        "image": item.image,
-                        "publisher": item.publisher,
-                        "tag": item.tag,
-                        "summary": item.summary,
-                        "is_summarized": item.is_summarized,
-                        "created_at": item.created_at,
-                        "updated_at": item.updated_at
-                    }
-                    for item in news_items
-                ],
-                "count": len(news_items)
-            }
-        
-        # Get news for specific language
-        news_items = db.query(News).filter(
-            News.tag == tag
-        ).order_by(News.created_at.desc()).limit(limit).all()
-        
-        return {
-            "status": "success",
-            "data": [
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "description": item.description,
-                    "content": item.content,
-                    "link": item.link,
-                    "pub_date": item.pub_date,
-                    "category": item.category,
-                    "image": item.image,
-                    "publisher": item.publisher,
-                    "tag": item.tag,
-                    "summary": item.summary,
-                    "is_summarized": item.is_summarized,
-                    "created_at": item.created_at,
-                    "updated_at": item.updated_at
-                }
-                for item in news_items
-            ],
-            "count": len(news_items),
-            "language": language
-        }
-        
+            criteria = (News.tag.in_(["nepaliNewsNp", "nepaliNewsEn"]),)
+
+        version = db.execute(list_version(*criteria)).one()
+        etag = make_etag("nepali_news", scope, *version, limit, cursor)
+        last_modified = list_last_modified(f"nepali_news:{scope}", version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+        # Serialized once per list version and page; later requests get the stored bytes
+        body = _page_bodies.get_or_load(etag, lambda: _encode_page(db, criteria, scope, limit, cursor))
+        return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=cache_headers(etag, last_modified))
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving Nepali news: {str(e)}")
-    finally:
-        db.close()
 
 
 @router.get("/stats", status_code=200)
-def get_nepali_news_stats():
+def get_nepali_news_stats(db: Session = Depends(get_db)):
     """
     Get statistics about Nepali news in database
     """
     try:
-        db = next(get_db())
-        
         # Count news by tag
         np_count = db.query(News).filter(News.tag == "nepaliNewsNp").count()
         en_count = db.query(News).filter(News.tag == "nepaliNewsEn").count()
@@ -138,5 +123,3 @@ def get_nepali_news_stats():
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving Nepali news stats: {str(e)}")
-    finally:
-        db.close()
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, FastAPI, Query, HTTPException
+from fastapi import APIRouter, FastAPI, Query, HTTPException, Request, Response
 from typing import Optional
-from service import news_service, international_news_service, sports_news_service, tech_news_service
+from service import news_service
+from service.fast_json import JSON_MEDIA_TYPE
+from service.http_cache import cache_headers, is_not_modified, not_modified_response
 
 app = FastAPI()
 
@@ -10,67 +12,54 @@ router = APIRouter(
 )
 
 
+def _payload_response(request: Request, payload, include_age: bool) -> Response:
+    """304 when the client has this version, otherwise the pre-encoded payload with its validators"""
+    if is_not_modified(request, payload.etag, payload.last_modified):
+        return not_modified_response(payload.etag, payload.last_modified)
+    return Response(content=payload.body(include_age), media_type=JSON_MEDIA_TYPE,
+                    headers=cache_headers(payload.etag, payload.last_modified))
+
+
 @router.get("/", status_code=200)
-def get_news(language: Optional[str] = Query("en", description="Language of the news feed")):
+def get_news(request: Request,
+             language: Optional[str] = Query("en", description="Language of the news feed")):
     print("Fetching news for language: ", language)
     try:
-        news = news_service.summarise_news(language)
-        if not news:
-            raise HTTPException(status_code=404, detail="No news found")
-        return {"status": "success", "data": news}
+        payload = news_service.get_news_payload(language)
+        return _payload_response(request, payload, include_age=False)
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @router.get("/international", status_code=200)
-def get_international_news():
-    print("Fetching international news directly from sources")
+def get_international_news(request: Request):
+    print("Fetching international news (cached)")
     try:
-        service = international_news_service.InternationalNewsService()
-        news = service.fetch_all_international_news()
-        if not news:
-            raise HTTPException(status_code=404, detail="No international news found")
-        return {"status": "success", "data": news}
+        payload = news_service.get_live_news("international")
+        return _payload_response(request, payload, include_age=True)
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @router.get("/sports", status_code=200)
-def get_sports_news():
-    print("Fetching sports news directly from sources")
+def get_sports_news(request: Request):
+    print("Fetching sports news (cached)")
     try:
-        service = sports_news_service.SportsNewsService()
-        news = service.fetch_all_sports_news()
-        if not news:
-            raise HTTPException(status_code=404, detail="No sports news found")
-        return {"status": "success", "data": news}
+        payload = news_service.get_live_news("sports")
+        return _payload_response(request, payload, include_age=True)
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @router.get("/tech", status_code=200)
-def get_tech_news():
-    print("Fetching tech news directly from sources")
+def get_tech_news(request: Request):
+    print("Fetching tech news (cached)")
     try:
-        service = tech_news_service.TechNewsService()
-        news = service.fetch_all_tech_news()
-        if not news:
-            raise HTTPException(status_code=404, detail="No tech news found")
-        # Sort news by pubDate descending, always using offset-aware datetimes
-        from datetime import datetime, timezone
-        def parse_pubdate(item):
-            pubdate = item.get("pubDate", "")
-            try:
-                # Always parse as offset-aware
-                return datetime.strptime(pubdate, "%a, %d %b %Y %H:%M:%S %z")
-            except Exception:
-                # Fallback: return a very old offset-aware datetime
-                return datetime.min.replace(tzinfo=timezone.utc)
-        news.sort(key=parse_pubdate, reverse=True)
-        return {"status": "success", "data": news}
+        payload = news_service.get_live_news("tech")
+        return _payload_response(request, payload, include_age=True)
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
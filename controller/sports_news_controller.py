@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any
-from db.db_connection import get_db
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Any, Optional
+from db.db_connection import get_async_db
 from models.news import News, NewsResponse
 from service.sports_news_service import SportsNewsService, process_sports_news
-from sqlalchemy import and_
+from service.http_cache import is_not_modified, make_etag, not_modified_response, set_cache_headers
+from service.pagination import MAX_PAGE_SIZE, list_last_modified, list_version, next_page, paginate, set_next_cursor
+from sqlalchemy import and_, func, select
 
 router = APIRouter(
     prefix="/sports-news",
@@ -38,7 +42,8 @@ async def process_sports_news_sync():
     This endpoint waits for the processing to complete
     """
     try:
-        result = process_sports_news()
+        # Fetching, saving and summarizing block; a worker thread keeps the event loop serving
+        result = await asyncio.to_thread(process_sports_news)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing sports news: {str(e)}")
@@ -46,21 +51,33 @@ async def process_sports_news_sync():
 
 @router.get("/", response_model=List[NewsResponse])
 async def get_sports_news(
-    limit: int = 50,
-    offset: int = 0,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get sports news from database
+    Get sports news from database, newest first
+    Pass the X-Next-Cursor response header back as cursor to get the next page
     """
     try:
-        news_items = db.query(News).filter(
-            News.tag == "sports_news"
-        ).order_by(
-            News.created_at.desc()
-        ).offset(offset).limit(limit).all()
+        criteria = (News.tag == "sports_news",)
+        version = (await db.execute(list_version(*criteria))).one()
+        etag = make_etag("sports_news", *version, limit, offset, cursor)
+        last_modified = list_last_modified("sports_news", version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        set_cache_headers(response, etag, last_modified)
+
+        query = select(News).filter(*criteria)
+        news_items, next_cursor = next_page((await db.scalars(paginate(query, limit, offset, cursor))).all(), limit)
+        set_next_cursor(response, next_cursor)
         
         return news_items
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sports news: {str(e)}")
 
@@ -68,18 +85,18 @@ async def get_sports_news(
 @router.get("/{news_id}", response_model=NewsResponse)
 async def get_sports_news_by_id(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific sports news item by ID
     """
     try:
-        news_item = db.query(News).filter(
+        news_item = await db.scalar(select(News).filter(
             and_(
                 News.id == news_id,
                 News.tag == "sports_news"
             )
-        ).first()
+        ))
         
         if not news_item:
             raise HTTPException(status_code=404, detail="Sports news item not found")
@@ -94,24 +111,24 @@ async def get_sports_news_by_id(
 @router.delete("/{news_id}")
 async def delete_sports_news(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a specific sports news item by ID
     """
     try:
-        news_item = db.query(News).filter(
+        news_item = await db.scalar(select(News).filter(
             and_(
                 News.id == news_id,
                 News.tag == "sports_news"
             )
-        ).first()
+        ))
         
         if not news_item:
             raise HTTPException(status_code=404, detail="Sports news item not found")
         
-        db.delete(news_item)
-        db.commit()
+        await db.delete(news_item)
+        await db.commit()
         
         return {"message": "Sports news item deleted successfully"}
     except HTTPException:
@@ -121,12 +138,12 @@ async def delete_sports_news(
 
 
 @router.get("/stats/summary")
-async def get_sports_news_stats(db: Session = Depends(get_db)):
+async def get_sports_news_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Get statistics about sports news in the database
     """
     try:
-        total_news = db.query(News).filter(News.tag == "sports_news").count()
+        total_news = await db.scalar(select(func.count()).select_from(News).filter(News.tag == "sports_news"))
         
         return {
             "total_news": total_news,
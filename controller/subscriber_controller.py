@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from db.db_connection import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.db_connection import get_async_db
 from models.subscribers import Subscribers, SubscriberCreate, SubscriberResponse
 
 router = APIRouter(
@@ -10,17 +11,17 @@ router = APIRouter(
 
 
 @router.get("/", response_model=list[SubscriberResponse])
-async def get_subscribers(db: Session = Depends(get_db)):
+async def get_subscribers(db: AsyncSession = Depends(get_async_db)):
     """Get all subscribers"""
-    subscribers = db.query(Subscribers).all()
+    subscribers = (await db.scalars(select(Subscribers))).all()
     return subscribers
 
 
 @router.post("/", response_model=SubscriberResponse)
-async def create_subscriber(subscriber: SubscriberCreate, db: Session = Depends(get_db)):
+async def create_subscriber(subscriber: SubscriberCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new subscriber"""
     # Check if the subscriber already exists
-    existing_subscriber = db.query(Subscribers).filter(Subscribers.mobNumber == subscriber.mobNumber).first()
+    existing_subscriber = await db.scalar(select(Subscribers).filter(Subscribers.mobNumber == subscriber.mobNumber))
     if existing_subscriber:
         raise HTTPException(status_code=400, detail="Subscriber already exists.")
     
@@ -32,29 +33,29 @@ async def create_subscriber(subscriber: SubscriberCreate, db: Session = Depends(
     )
     
     db.add(db_subscriber)
-    db.commit()
-    db.refresh(db_subscriber)
+    await db.commit()
+    await db.refresh(db_subscriber)
     
     return db_subscriber
 
 
 @router.get("/{subscriber_id}", response_model=SubscriberResponse)
-async def get_subscriber(subscriber_id: int, db: Session = Depends(get_db)):
+async def get_subscriber(subscriber_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific subscriber by ID"""
-    subscriber = db.query(Subscribers).filter(Subscribers.id == subscriber_id).first()
+    subscriber = await db.scalar(select(Subscribers).filter(Subscribers.id == subscriber_id))
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found.")
     return subscriber
 
 
 @router.delete("/{subscriber_id}")
-async def delete_subscriber(subscriber_id: int, db: Session = Depends(get_db)):
+async def delete_subscriber(subscriber_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete a subscriber by ID"""
-    subscriber = db.query(Subscribers).filter(Subscribers.id == subscriber_id).first()
+    subscriber = await db.scalar(select(Subscribers).filter(Subscribers.id == subscriber_id))
     if not subscriber:
         raise HTTPException(status_code=404, detail="Subscriber not found.")
     
-    db.delete(subscriber)
-    db.commit()
+    await db.delete(subscriber)
+    await db.commit()
     
     return {"message": "Subscriber deleted successfully."}
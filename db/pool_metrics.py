@@ -0,0 +1,179 @@
+"""
+Connection pool metrics
+Records how long requests wait for a pooled connection and how long they hold it, next to
+live pool gauges (checked out, idle, overflow), so the pool can be sized from data.
+Exposed by controller/metrics_controller.py as Prometheus text and JSON.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds in seconds; the last bucket (+Inf) is implicit
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style, safe to update from any thread"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return {
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], cumulative)),
+            "sum": total,
+            "count": running,
+        }
+
+
+class PoolMetrics:
+    """Measurements for one engine's pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wait_seconds = Histogram()
+        self.hold_seconds = Histogram()
+        self.timeouts = 0
+        self.pool = None
+
+    def gauges(self) -> Dict[str, Optional[int]]:
+        pool = self.pool
+        if pool is None or not hasattr(pool, "checkedout"):
+            return {"size": None, "checked_out": None, "idle": None, "overflow": None}
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            **self.gauges(),
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait_seconds.snapshot(),
+            "hold_seconds": self.hold_seconds.snapshot(),
+        }
+
+
+POOL_METRICS: Dict[str, PoolMetrics] = {
+    "sync": PoolMetrics("sync"),
+    "async": PoolMetrics("async"),
+}
+
+
+class _TimedPoolMixin:
+    """Times every connection checkout, including waits for a free slot and new connects"""
+
+    metrics_name = "sync"
+
+    def _do_get(self):
+        metrics = POOL_METRICS[self.metrics_name]
+        # The pool is replaced on engine.dispose(), so always track the live instance
+        metrics.pool = self
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.timeouts += 1
+            raise
+        finally:
+            metrics.wait_seconds.observe(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    metrics_name = "sync"
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    metrics_name = "async"
+
+
+def instrument_engine(engine, name: str):
+    """
+    Record how long connections stay checked out
+
+    Args:
+        engine: Sync Engine, or AsyncEngine.sync_engine
+        name (str): "sync" or "async"
+    """
+    metrics = POOL_METRICS[name]
+    metrics.pool = engine.pool
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            metrics.hold_seconds.observe(time.perf_counter() - checked_out_at)
+
+
+def histogram_lines(metric: str, labels: str, histogram: Histogram) -> List[str]:
+    """Prometheus lines for one histogram series; labels like 'pool="sync"'"""
+    snapshot = histogram.snapshot()
+    prefix = f"{labels}," if labels else ""
+    series = f"{{{labels}}}" if labels else ""
+    lines = [f'{metric}_bucket{{{prefix}le="{le}"}} {count}' for le, count in snapshot["buckets"].items()]
+    lines.append(f'{metric}_sum{series} {snapshot["sum"]:.6f}')
+    lines.append(f'{metric}_count{series} {snapshot["count"]}')
+    return lines
+
+
+def render_prometheus() -> str:
+    """All pool metrics in the Prometheus text exposition format"""
+    lines = []
+    gauges = {
+        "db_pool_size": "Configured number of persistent connections",
+        "db_pool_checked_out": "Connections currently in use",
+        "db_pool_idle": "Connections idle in the pool",
+        "db_pool_overflow": "Connections open beyond the pool size",
+    }
+    for metric, description in gauges.items():
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} gauge")
+        for name, metrics in POOL_METRICS.items():
+            value = metrics.gauges()[metric[len("db_pool_"):]]
+            if value is not None:
+                lines.append(f'{metric}{{pool="{name}"}} {value}')
+
+    lines.append("# HELP db_pool_timeouts_total Checkouts that gave up after DB_POOL_TIMEOUT")
+    lines.append("# TYPE db_pool_timeouts_total counter")
+    for name, metrics in POOL_METRICS.items():
+        lines.append(f'db_pool_timeouts_total{{pool="{name}"}} {metrics.timeouts}')
+
+    histograms = {
+        "db_pool_wait_seconds": ("Time to obtain a connection from the pool", "wait_seconds"),
+        "db_pool_hold_seconds": ("Time a connection stays checked out", "hold_seconds"),
+    }
+    for metric, (description, attribute) in histograms.items():
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} histogram")
+        for name, metrics in POOL_METRICS.items():
+            lines.extend(histogram_lines(metric, f'pool="{name}"', getattr(metrics, attribute)))
+
+    return "\n".join(lines) + "\n"
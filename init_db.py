@@ -20,6 +20,7 @@ def init_database():
         from db.db_connection import create_tables, engine
         from models.subscribers import Subscribers
         from models.news import News
+        from models.summary_cache import SummaryCache
 
         print("Connecting to database...")
 
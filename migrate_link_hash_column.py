@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the link_hash column and the (tag, link_hash) unique constraint
+Existing rows are backfilled, duplicate articles are removed (the oldest row is kept),
+and only then is the constraint added.
+"""
+
+import os
+import sys
+from dotenv import load_dotenv
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Load environment variables
+load_dotenv()
+
+# Must match models.news.news_link_hash: sha256 of the link, or of "title:<title>" without a link
+LINK_HASH_SQL = """
+    encode(sha256(convert_to(
+        COALESCE(NULLIF(link, ''), 'title:' || COALESCE(title, '')), 'UTF8'
+    )), 'hex')
+"""
+
+
+def migrate_link_hash_column():
+    """Add and backfill link_hash, then enforce one row per (tag, link_hash)"""
+    try:
+        from db.db_connection import engine
+        from sqlalchemy import text
+
+        print("🔄 Migrating link_hash column...")
+        print("=" * 50)
+
+        # One transaction: either the table ends up fully migrated or it is left untouched
+        with engine.begin() as conn:
+            print("✓ Connected to database")
+
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'news'
+                );
+            """))
+
+            if not result.scalar():
+                print("❌ News table does not exist")
+                return False
+
+            print("✓ News table exists")
+
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.table_constraints
+                    WHERE table_name = 'news' AND constraint_name = 'uq_news_tag_link_hash'
+                );
+            """))
+
+            if result.scalar():
+                print("✅ link_hash column and unique constraint already exist")
+                return True
+
+            print("🔄 Adding link_hash column...")
+            conn.execute(text("ALTER TABLE news ADD COLUMN IF NOT EXISTS link_hash VARCHAR(64);"))
+
+            print("🔄 Backfilling link_hash...")
+            result = conn.execute(text(f"UPDATE news SET link_hash = {LINK_HASH_SQL} WHERE link_hash IS NULL;"))
+            print(f"📊 Backfilled {result.rowcount} rows")
+
+            print("🗑️  Removing duplicate articles...")
+            result = conn.execute(text("""
+                DELETE FROM news newer
+                USING news older
+                WHERE newer.tag = older.tag
+                  AND newer.link_hash = older.link_hash
+                  AND newer.id > older.id;
+            """))
+            print(f"📊 Removed {result.rowcount} duplicate rows")
+
+            print("🔄 Adding unique constraint...")
+            conn.execute(text("ALTER TABLE news ALTER COLUMN link_hash SET NOT NULL;"))
+            conn.execute(text("""
+                ALTER TABLE news
+                ADD CONSTRAINT uq_news_tag_link_hash UNIQUE (tag, link_hash);
+            """))
+
+            print("✅ Migration completed successfully!")
+            return True
+
+    except Exception as e:
+        print(f"❌ Migration error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    print("Link Hash Column Migration")
+    print("=" * 40)
+
+    migrate_link_hash_column()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the published_at TIMESTAMPTZ column
+pub_date strings are parsed with the same tolerant parser used at ingest and written back in
+batches, each committed on its own, so the table is never locked for the whole backfill.
+Rows whose pub_date cannot be parsed fall back to created_at. The index is built CONCURRENTLY,
+as in alembic revision 0002, so writes continue while it is built.
+"""
+
+import os
+import sys
+from datetime import timezone
+from dotenv import load_dotenv
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Load environment variables
+load_dotenv()
+
+BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "1000"))
+
+
+def migrate_published_at_column():
+    """Add, backfill and index published_at"""
+    try:
+        from db.db_connection import engine
+        from newsFeeds.dates import parse_pub_date
+        from sqlalchemy import text
+
+        print("🔄 Migrating published_at column...")
+        print("=" * 50)
+
+        with engine.connect() as conn:
+            print("✓ Connected to database")
+
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'news'
+                );
+            """))
+
+            if not result.scalar():
+                print("❌ News table does not exist")
+                return False
+
+            print("✓ News table exists")
+
+            print("🔄 Adding published_at column...")
+            conn.execute(text("ALTER TABLE news ADD COLUMN IF NOT EXISTS published_at TIMESTAMP WITH TIME ZONE;"))
+            conn.commit()
+
+            # Walk the table by id so every batch is an index range scan, however far along we are
+            print(f"🔄 Backfilling published_at in batches of {BATCH_SIZE}...")
+            last_id = 0
+            parsed = fallback = 0
+            while True:
+                rows = conn.execute(text("""
+                    SELECT id, pub_date, created_at
+                    FROM news
+                    WHERE id > :last_id AND published_at IS NULL
+                    ORDER BY id
+                    LIMIT :batch_size;
+                """), {"last_id": last_id, "batch_size": BATCH_SIZE}).fetchall()
+
+                if not rows:
+                    break
+
+                updates = []
+                for row_id, pub_date, created_at in rows:
+                    published_at = parse_pub_date(pub_date)
+                    if published_at is not None:
+                        parsed += 1
+                    else:
+                        fallback += 1
+                        # created_at is stored as naive UTC
+                        published_at = created_at.replace(tzinfo=timezone.utc) if created_at else None
+                    updates.append({"id": row_id, "published_at": published_at})
+
+                conn.execute(text("""
+                    UPDATE news SET published_at = COALESCE(:published_at, now()) WHERE id = :id;
+                """), updates)
+                conn.commit()
+
+                last_id = rows[-1][0]
+                print(f"   ✓ Backfilled up to id {last_id}")
+
+            print(f"📊 Parsed {parsed} dates, {fallback} fell back to created_at")
+
+            conn.execute(text("ALTER TABLE news ALTER COLUMN published_at SET NOT NULL;"))
+            conn.commit()
+
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction. If the build fails it leaves
+            # an INVALID index behind; drop it and rerun.
+            print("📊 Creating (tag, published_at DESC) index concurrently...")
+            autocommit_conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            autocommit_conn.execute(text("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_tag_published_at
+                ON news (tag, published_at DESC, id DESC);
+            """))
+
+            print("✅ Migration completed successfully!")
+            return True
+
+    except Exception as e:
+        print(f"❌ Migration error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    print("Published At Column Migration")
+    print("=" * 40)
+
+    migrate_published_at_column()
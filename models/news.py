@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+import hashlib
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from db.db_connection import Base
 from pydantic import BaseModel
@@ -6,15 +8,27 @@ from typing import Optional
 from datetime import datetime
 
 
+def news_link_hash(link: Optional[str], title: Optional[str]) -> str:
+    """Deduplication key for a news item: sha256 of its link, or of its title when it has no link"""
+    key = link if link else f"title:{title or ''}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
 class News(Base):
     __tablename__ = "news"
+    __table_args__ = (
+        # One row per article per tag; refreshes insert with ON CONFLICT DO NOTHING on this key
+        UniqueConstraint("tag", "link_hash", name="uq_news_tag_link_hash"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False, index=True)
     description = Column(Text, nullable=True)
     content = Column(Text, nullable=True)
     link = Column(String(1000), nullable=True)
+    link_hash = Column(String(64), nullable=False)  # See news_link_hash
     pub_date = Column(String(255), nullable=True)  # Store as string to preserve original format
+    published_at = Column(DateTime(timezone=True), nullable=False)  # Parsed pub_date, ingest time when unparseable
     category = Column(String(100), nullable=True)
     image = Column(String(1000), nullable=True)
     publisher = Column(String(200), nullable=True)
@@ -25,6 +39,13 @@ class News(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+# List endpoints filter on tag and order newest first; see alembic/versions/0002
+Index("ix_news_tag_published_at", News.tag, News.published_at.desc(), News.id.desc())
+Index("ix_news_tag_published_at_summarized", News.tag, News.published_at.desc(), News.id.desc(),
+      postgresql_where=News.is_summarized)
+Index("ix_news_tag_created_at", News.tag, News.created_at.desc())
+
+
 # Pydantic models for API requests/responses
 class NewsCreate(BaseModel):
     title: str
@@ -47,6 +68,7 @@ class NewsResponse(BaseModel):
     content: Optional[str] = None
     link: Optional[str] = None
     pub_date: Optional[str] = None  # Return as string
+    published_at: Optional[datetime] = None
     category: Optional[str] = None
     image: Optional[str] = None
     publisher: Optional[str] = None
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Text, DateTime
+from db.db_connection import Base
+from datetime import datetime
+
+
+class SummaryCache(Base):
+    """Summaries keyed by their input, shared by every article and request with the same text"""
+    __tablename__ = "summary_cache"
+
+    content_hash = Column(String(64), primary_key=True)  # See service.summary_cache.summary_key
+    model = Column(String(255), nullable=False)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,75 @@
+"""
+Publication date parsing
+Publishers format pubDate in several ways (RFC 822 with numeric or named zones, ISO 8601,
+bare "YYYY-MM-DD HH:MM:SS"). parse_pub_date turns any of them into an aware UTC datetime.
+Results are memoized because the same strings come back on every refresh.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+# Tried in order after the RFC 822 parser
+_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%a, %d %b %Y %H:%M %z",
+    "%d %b %Y %H:%M:%S %z",
+    "%Y-%m-%d",
+)
+
+# Sort key for items without a usable date: older than anything real
+MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Dates without a zone are taken to be UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _parse(value: str) -> Optional[datetime]:
+    try:
+        return _as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    for date_format in _FORMATS:
+        try:
+            return _as_utc(datetime.strptime(value, date_format))
+        except ValueError:
+            continue
+
+    # Slowest but most forgiving; only reached for unusual formats
+    from dateutil import parser as dateutil_parser
+
+    try:
+        return _as_utc(dateutil_parser.parse(value))
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a feed publication date
+
+    Args:
+        value (str): Raw pubDate string as published in the feed
+
+    Returns:
+        datetime: Aware UTC datetime, or None when the value cannot be parsed
+    """
+    if not value or not value.strip():
+        return None
+    return _parse(value.strip())
+
+
+def pub_date_sort_key(news_item) -> datetime:
+    """Sort key for news item dicts, newest first with reverse=True"""
+    return parse_pub_date(news_item.get("pubDate")) or MIN_DATETIME
@@ -0,0 +1,113 @@
+"""
+Conditional GET cache for feed downloads
+This module stores each feed URL's ETag/Last-Modified validators and body on disk,
+and keeps the last parsed entries in memory so unchanged feeds are never parsed twice
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Set FEED_CACHE_DIR to an empty string to disable revalidation
+FEED_CACHE_DIR = os.getenv("FEED_CACHE_DIR", ".feed_cache")
+
+
+class FeedCache:
+    """On-disk validator/body store plus an in-memory parsed-entries store, keyed by feed URL"""
+
+    def __init__(self, directory: Optional[str]):
+        self.directory = directory
+        self._parsed: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def _path(self, url: str, suffix: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.{suffix}")
+
+    def _read_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url, "json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def version(etag: Optional[str], last_modified: Optional[str]) -> str:
+        return f"{etag or ''}|{last_modified or ''}"
+
+    def conditional_headers(self, url: str) -> Tuple[Dict[str, str], Optional[str]]:
+        """
+        Request headers that let the publisher answer 304 Not Modified
+
+        Returns:
+            tuple: (headers, version of the cached body or None when there is nothing to revalidate)
+        """
+        if not self.enabled:
+            return {}, None
+        meta = self._read_meta(url)
+        # Validators are useless without a body to fall back on
+        if not meta or not os.path.exists(self._path(url, "body")):
+            return {}, None
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers, self.version(meta.get("etag"), meta.get("last_modified"))
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        try:
+            with open(self._path(url, "body"), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """Remember a fresh 200 response; feeds without validators are not worth caching"""
+        if not self.enabled or not (etag or last_modified):
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_atomic(self._path(url, "body"), body)
+            meta = {"url": url, "etag": etag, "last_modified": last_modified}
+            self._write_atomic(self._path(url, "json"), json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            print(f"✗ Error caching feed {url}: {e}")
+
+    def parsed_entries(self, url: str, version: str) -> Optional[List[Dict[str, Any]]]:
+        """Copies of the entries parsed from this version of the feed, if this process has parsed it"""
+        with self._lock:
+            cached = self._parsed.get(url)
+        if cached is None or cached["version"] != version:
+            return None
+        news_items = cached["items"]
+        # Callers annotate and truncate items in place, so hand out copies
+        return [dict(item) for item in news_items]
+
+    def remember_parsed(self, url: str, version: Optional[str], news_items: List[Dict[str, Any]]):
+        if not self.enabled or version is None:
+            return
+        with self._lock:
+            self._parsed[url] = {"version": version, "items": [dict(item) for item in news_items]}
+
+
+feed_cache = FeedCache(FEED_CACHE_DIR)
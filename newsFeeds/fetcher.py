@@ -0,0 +1,195 @@
+"""
+Async RSS fetch engine
+This module downloads every configured feed concurrently and hands the raw bytes to the parsers.
+httpx is imported on first fetch so that importing the application stays cheap.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from newsFeeds.feed_cache import FeedCache, feed_cache
+from newsFeeds.parse_pool import parse_feeds
+from newsFeeds.registry import FeedSpec
+
+if TYPE_CHECKING:
+    import httpx
+
+load_dotenv()
+
+# Per-source timeout (seconds) and global cap on simultaneous downloads
+FEED_TIMEOUT = float(os.getenv("FEED_TIMEOUT", "10"))
+FEED_MAX_CONCURRENCY = int(os.getenv("FEED_MAX_CONCURRENCY", "8"))
+
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/rss+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5',
+}
+
+
+class FeedResult:
+    """Outcome of downloading a single feed"""
+
+    def __init__(self, name: str, url: Optional[str], body: Optional[bytes] = None,
+                 error: Optional[str] = None, elapsed: float = 0.0,
+                 not_modified: bool = False, version: Optional[str] = None):
+        self.name = name
+        self.url = url
+        self.body = body
+        self.error = error
+        self.elapsed = elapsed
+        # True when the publisher answered 304 and body is the cached copy
+        self.not_modified = not_modified
+        # Validator fingerprint of body, None when the publisher sends no ETag/Last-Modified
+        self.version = version
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.body is not None
+
+
+async def _fetch_one(client: "httpx.AsyncClient", semaphore: asyncio.Semaphore, name: str,
+                     url: Optional[str], timeout: float) -> FeedResult:
+    import httpx
+
+    if not url:
+        return FeedResult(name, url, error="Feed URL is not configured")
+
+    async with semaphore:
+        start = time.perf_counter()
+        headers, cached_version = feed_cache.conditional_headers(url)
+        try:
+            # wait_for bounds the whole exchange (connect, redirects and body), not just each socket read
+            response = await asyncio.wait_for(client.get(url, headers=headers), timeout)
+            if response.status_code == 304 and cached_version is not None:
+                body = feed_cache.load_body(url)
+                if body is not None:
+                    return FeedResult(name, url, body=body, elapsed=time.perf_counter() - start,
+                                      not_modified=True, version=cached_version)
+                # The cached body vanished underneath us, fetch it again unconditionally
+                response = await asyncio.wait_for(client.get(url), timeout)
+            response.raise_for_status()
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            feed_cache.store(url, response.content, etag, last_modified)
+            version = FeedCache.version(etag, last_modified) if (etag or last_modified) else None
+            return FeedResult(name, url, body=response.content, elapsed=time.perf_counter() - start,
+                              version=version)
+        except asyncio.TimeoutError:
+            return FeedResult(name, url, error=f"Timed out after {timeout:.0f}s",
+                              elapsed=time.perf_counter() - start)
+        except httpx.HTTPStatusError as e:
+            return FeedResult(name, url, error=f"HTTP {e.response.status_code} from {url}",
+                              elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return FeedResult(name, url, error=str(e) or type(e).__name__,
+                              elapsed=time.perf_counter() - start)
+
+
+async def fetch_feeds_async(urls: Dict[str, Optional[str]], timeout: Optional[float] = None,
+                            max_concurrency: Optional[int] = None) -> Dict[str, FeedResult]:
+    """
+    Download all feeds at the same time
+
+    Args:
+        urls (dict): Source name -> feed URL
+        timeout (float): Per-source timeout in seconds
+        max_concurrency (int): Maximum number of downloads in flight
+
+    Returns:
+        dict: Source name -> FeedResult
+    """
+    import httpx
+
+    timeout = timeout or FEED_TIMEOUT
+    semaphore = asyncio.Semaphore(max_concurrency or FEED_MAX_CONCURRENCY)
+
+    # SSL verification is disabled because some publishers serve broken certificate chains
+    async with httpx.AsyncClient(headers=_REQUEST_HEADERS, follow_redirects=True, verify=False,
+                                 timeout=timeout) as client:
+        results = await asyncio.gather(
+            *(_fetch_one(client, semaphore, name, url, timeout) for name, url in urls.items())
+        )
+    return {result.name: result for result in results}
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code
+
+    The services are called both from worker threads and directly from async endpoints,
+    so when an event loop is already running the coroutine is executed on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def fetch_feeds(urls: Dict[str, Optional[str]], timeout: Optional[float] = None,
+                max_concurrency: Optional[int] = None) -> Dict[str, FeedResult]:
+    """Blocking wrapper around fetch_feeds_async"""
+    return run_sync(fetch_feeds_async(urls, timeout=timeout, max_concurrency=max_concurrency))
+
+
+def fetch_sources(specs: List[FeedSpec]) -> List[Tuple[FeedSpec, List[Dict[str, Any]]]]:
+    """
+    Download every source concurrently, then parse the ones that changed
+
+    Args:
+        specs (list): Registry entries to refresh
+
+    Returns:
+        list: (spec, news items) for every source that succeeded, in the given order
+    """
+    start = time.perf_counter()
+    results = fetch_feeds({spec.key: spec.url for spec in specs})
+
+    reused: Dict[str, List[Dict[str, Any]]] = {}
+    to_parse = []
+    for spec in specs:
+        result = results[spec.key]
+        if not result.ok:
+            continue
+        # A 304 means the entries parsed last time are still current, so skip parsing entirely
+        news_items = feed_cache.parsed_entries(result.url, result.version) if result.not_modified else None
+        if news_items is not None:
+            reused[spec.key] = news_items
+        else:
+            to_parse.append((spec, result.body))
+
+    parse_start = time.perf_counter()
+    parsed = parse_feeds(to_parse)
+    parse_elapsed = time.perf_counter() - parse_start
+
+    collected = []
+    for spec in specs:
+        result = results[spec.key]
+        try:
+            if not result.ok:
+                raise RuntimeError(result.error)
+
+            if spec.key in reused:
+                news_items = reused[spec.key]
+                print(f"✓ {spec.name} unchanged, reusing {len(news_items)} items ({result.elapsed:.2f}s)")
+            else:
+                news_items = parsed[spec.key]
+                if isinstance(news_items, Exception):
+                    raise news_items
+                feed_cache.remember_parsed(result.url, result.version, news_items)
+                print(f"✓ Fetched {len(news_items)} {spec.name} items ({result.elapsed:.2f}s)")
+            collected.append((spec, news_items))
+        except Exception as e:
+            print(f"✗ Error fetching {spec.name}: {e}")
+
+    print(f"⏱  Fetched {len(specs)} feeds in {time.perf_counter() - start:.2f}s "
+          f"(parsed {len(to_parse)} in {parse_elapsed:.2f}s)")
+    return collected
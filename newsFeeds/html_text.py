@@ -0,0 +1,173 @@
+"""
+Fast HTML-to-text extraction
+Streams the markup through the standard library HTMLParser and collects text without
+building a tree. The output is identical to
+BeautifulSoup(markup, "html.parser").get_text(separator="\\n"), so it can replace the
+per-entry soup in feed parsing.
+"""
+
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Dict, List
+
+# Characters BeautifulSoup treats as whitespace when collapsing whitespace-only strings
+_ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+# Tags closed immediately by html.parser because they can never have content
+_VOID_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem', 'meta', 'param',
+    'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame', 'image', 'isindex', 'nextid', 'spacer',
+])
+
+# Whitespace inside these tags is kept as-is
+_PRESERVE_WHITESPACE_TAGS = frozenset(['pre', 'textarea'])
+
+# Strings inside these tags are not plain text (scripts, stylesheets, templates, ruby annotations)
+_HIDDEN_TEXT_TAGS = frozenset(['rt', 'rp', 'style', 'script', 'template'])
+
+
+def _build_entity_table() -> Dict[str, str]:
+    # Same table BeautifulSoup uses: HTML5 entity names without the trailing semicolon
+    entities = {}
+    for name_with_semicolon, character in sorted(html5.items()):
+        entities.setdefault(name_with_semicolon.rstrip(';'), character)
+    return entities
+
+
+_ENTITIES = _build_entity_table()
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the strings get_text() would return, tracking only the tag state that affects them"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.strings: List[str] = []
+        self._data: List[str] = []
+        self._stack: List[str] = []
+        self._open_counts: Dict[str, int] = {}
+        self._preserve_depth = 0
+        self._hidden_depth = 0
+        self._already_closed: List[str] = []
+
+    def _flush(self, keep: bool = True):
+        if not self._data:
+            return
+        data = ''.join(self._data)
+        self._data = []
+        if not self._preserve_depth and not data.strip(_ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        if keep:
+            self.strings.append(data)
+
+    def _push(self, name: str):
+        self._stack.append(name)
+        self._open_counts[name] = self._open_counts.get(name, 0) + 1
+        if name in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth += 1
+        if name in _HIDDEN_TEXT_TAGS:
+            self._hidden_depth += 1
+
+    def _pop(self):
+        name = self._stack.pop()
+        self._open_counts[name] -= 1
+        if name in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth -= 1
+        if name in _HIDDEN_TEXT_TAGS:
+            self._hidden_depth -= 1
+        return name
+
+    def _close(self, name: str):
+        self._flush(keep=not self._hidden_depth)
+        if not self._open_counts.get(name):
+            return
+        while self._pop() != name:
+            pass
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag, handle_empty_element=True)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag, handle_empty_element=False)
+        self.handle_endtag(tag)
+
+    def _start(self, tag: str, handle_empty_element: bool):
+        self._flush(keep=not self._hidden_depth)
+        self._push(tag)
+        if handle_empty_element and tag in _VOID_TAGS:
+            self._close(tag)
+            # A later explicit closing tag for this element is ignored
+            self._already_closed.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._already_closed:
+            self._already_closed.remove(tag)
+        else:
+            self._close(tag)
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_charref(self, name):
+        if name.startswith(('x', 'X')):
+            codepoint = int(name.lstrip('xX'), 16)
+        else:
+            codepoint = int(name)
+
+        data = None
+        if codepoint < 256:
+            # Numeric references below 256 are often meant as Windows-1252 (e.g. &#147;)
+            try:
+                data = bytearray([codepoint]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(codepoint)
+            except (ValueError, OverflowError):
+                pass
+        self.handle_data(data or "\N{REPLACEMENT CHARACTER}")
+
+    def handle_entityref(self, name):
+        character = _ENTITIES.get(name)
+        self.handle_data(character if character is not None else "&%s" % name)
+
+    def handle_comment(self, data):
+        self._flush(keep=not self._hidden_depth)
+
+    def handle_decl(self, decl):
+        self._flush(keep=not self._hidden_depth)
+
+    def handle_pi(self, data):
+        self._flush(keep=not self._hidden_depth)
+
+    def unknown_decl(self, data):
+        self._flush(keep=not self._hidden_depth)
+        if data.upper().startswith('CDATA['):
+            # CDATA sections count as text even inside scripts and styles
+            self._data.append(data[len('CDATA['):])
+            self._flush(keep=True)
+
+
+def html_to_text(markup: str, separator: str = "\n") -> str:
+    """
+    Strip HTML down to its text
+
+    Args:
+        markup (str): HTML fragment, e.g. an RSS content:encoded value
+        separator (str): Joins the individual text nodes
+
+    Returns:
+        str: Same result as BeautifulSoup(markup, "html.parser").get_text(separator=separator)
+    """
+    if '<' not in markup and '&' not in markup:
+        # Plain text: a single string, only subject to whitespace collapsing
+        if markup and not markup.strip(_ASCII_SPACES):
+            return '\n' if '\n' in markup else ' '
+        return markup
+
+    extractor = _TextExtractor()
+    extractor.feed(markup)
+    extractor.close()
+    extractor._flush(keep=not extractor._hidden_depth)
+    return separator.join(extractor.strings)
@@ -0,0 +1,109 @@
+"""
+Process-pool parse stage
+Parsing feed XML and stripping entry HTML is CPU bound and holds the GIL, so a big refresh
+saturates one core. When FEED_PARSE_WORKERS is above 1, raw feed bytes are handed to a shared
+ProcessPoolExecutor and only compact item dicts travel back. With 0 or 1 worker everything is
+parsed inline, exactly as before.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+
+from newsFeeds.registry import FeedSpec, get_source, parse_feed
+
+load_dotenv()
+
+# Number of parser processes; 0 or 1 parses in the calling process
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", "0"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _compact(item: Dict[str, Any]) -> Dict[str, Any]:
+    # feedparser hands back str subclasses; plain str keeps the pickled result small
+    return {key: str(value) if isinstance(value, str) else value for key, value in item.items()}
+
+
+def _parse_in_worker(key: str, body: bytes) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """Runs in a pool process. Specs hold closures, so the worker looks its spec up by key."""
+    try:
+        items = parse_feed(get_source(key), body)
+    except HTTPException as e:
+        return None, e.detail
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+    return [_compact(item) for item in items], None
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = None
+
+
+def shutdown_parse_pool():
+    """Stop the worker processes, e.g. on application shutdown"""
+    _discard_pool()
+
+
+def _parse_inline(jobs: List[Tuple[FeedSpec, bytes]]) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+    parsed = {}
+    for spec, body in jobs:
+        try:
+            parsed[spec.key] = parse_feed(spec, body)
+        except Exception as e:
+            parsed[spec.key] = e
+    return parsed
+
+
+def parse_feeds(jobs: List[Tuple[FeedSpec, bytes]],
+                workers: Optional[int] = None) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+    """
+    Parse several downloaded feeds, across processes when configured
+
+    Args:
+        jobs (list): (spec, raw feed bytes) pairs
+        workers (int): Overrides FEED_PARSE_WORKERS
+
+    Returns:
+        dict: Source key -> news items, or the exception raised while parsing that source
+    """
+    workers = FEED_PARSE_WORKERS if workers is None else workers
+    if workers <= 1 or len(jobs) <= 1:
+        # A single feed gains nothing from a round trip through another process
+        return _parse_inline(jobs)
+
+    try:
+        pool = _get_pool(workers)
+        futures = {spec.key: pool.submit(_parse_in_worker, spec.key, body) for spec, body in jobs}
+        parsed = {}
+        for spec, _ in jobs:
+            items, error = futures[spec.key].result()
+            parsed[spec.key] = items if error is None else HTTPException(status_code=500, detail=error)
+        return parsed
+    except BrokenProcessPool as e:
+        # A worker died (e.g. killed for memory); start a fresh pool next time and finish this batch inline
+        print(f"✗ Parse pool failed, parsing inline: {e}")
+        _discard_pool()
+        return _parse_inline(jobs)
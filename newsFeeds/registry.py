@@ -0,0 +1,234 @@
+"""
+Declarative feed registry
+Every RSS source is described by a FeedSpec; adding a source is a new entry in SOURCES.
+Each spec compiles its image rule once, so per-entry extraction runs on a precompiled fast path.
+feedparser is imported on first parse to keep application startup light.
+"""
+
+import html
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+
+from newsFeeds.html_text import html_to_text
+from service import generateImage
+
+load_dotenv()
+
+# Where the article body comes from
+SUMMARY_BODY = "summary"          # title_detail/summary_detail, used by the international feeds
+CONTENT_HTML_BODY = "content_html"  # content:encoded HTML stripped to text, used by the Nepali feeds
+
+# Image rules
+ENCLOSURE_IMAGE = "enclosure"
+MEDIA_CONTENT_IMAGE = "media_content"
+MEDIA_THUMBNAIL_IMAGE = "media_thumbnail"
+
+
+def clean_title(news_item):
+    # Decode HTML entities in a loop until all are unescaped
+    while True:
+        decoded_title = html.unescape(news_item)
+        if decoded_title == news_item:  # Stop when no further decoding is needed
+            break
+        news_item = decoded_title
+    return news_item
+
+
+def replace_all(*pairs):
+    """URL rewrite applying str.replace for each (old, new) pair in order"""
+    def rewrite(url: str) -> str:
+        for old, new in pairs:
+            url = url.replace(old, new)
+        return url
+    return rewrite
+
+
+def toi_image(url: str) -> str:
+    # Fix TOI image URL format: remove .cms and add .jpeg
+    if 'toiimg.com' in url:
+        return f"{url.split('.cms')[0]}.jpeg"
+    return url
+
+
+class FeedSpec:
+    """
+    Description of a single RSS source
+
+    Args:
+        key (str): Unique identifier, also the name of the legacy parser function
+        name (str): Human readable source name used in logs
+        env_var (str): Environment variable holding the feed URL
+        publisher (str): Publisher stored on every item
+        group (str): Which refresh the source belongs to (international, sports, tech, nepali_en, nepali_np)
+        body (str): SUMMARY_BODY or CONTENT_HTML_BODY
+        image (str): ENCLOSURE_IMAGE, MEDIA_CONTENT_IMAGE, MEDIA_THUMBNAIL_IMAGE or a regex run over the content HTML
+        category (str): Fixed category, None to take it from the entry
+        image_rewrite (callable): Optional image URL rewrite
+        generate_missing_image (bool): Fall back to a generated image when the entry has none
+        description_falls_back_to_title (bool): Use the title when the description is empty
+    """
+
+    def __init__(self, key: str, name: str, env_var: str, publisher: str, group: str, body: str, image: str,
+                 category: Optional[str] = None, image_rewrite: Optional[Callable[[str], str]] = None,
+                 generate_missing_image: bool = False, description_falls_back_to_title: bool = False):
+        self.key = key
+        self.name = name
+        self.env_var = env_var
+        self.publisher = publisher
+        self.group = group
+        self.body = body
+        self.category = category
+        self.image_rewrite = image_rewrite
+        self.generate_missing_image = generate_missing_image
+        self.description_falls_back_to_title = description_falls_back_to_title
+        self.extract_image = self._compile_image_rule(image)
+
+    @property
+    def language(self) -> str:
+        return 'np' if self.group == "nepali_np" else 'en'
+
+    @property
+    def url(self) -> Optional[str]:
+        return os.getenv(self.env_var)
+
+    def _compile_image_rule(self, image: str) -> Callable[[Any, Optional[str]], Optional[str]]:
+        if image == ENCLOSURE_IMAGE:
+            def extract(entry, content_value):
+                for enclosure in entry.get('enclosures') or ():
+                    if enclosure.get('type', '').startswith('image/'):
+                        return enclosure.get('url')
+                return None
+        elif image == MEDIA_CONTENT_IMAGE:
+            def extract(entry, content_value):
+                for media in entry.get('media_content') or ():
+                    if media.get('medium') == 'image':
+                        return media.get('url')
+                return None
+        elif image == MEDIA_THUMBNAIL_IMAGE:
+            def extract(entry, content_value):
+                thumbnails = entry.get('media_thumbnail')
+                return thumbnails[0].get('url') if thumbnails else None
+        else:
+            search = re.compile(image).search
+
+            def extract(entry, content_value):
+                match = search(content_value) if content_value else None
+                return match.group(0) if match else None
+        return extract
+
+    def build_item(self, entry) -> Dict[str, Any]:
+        if self.body == SUMMARY_BODY:
+            title = clean_title(entry.title)
+            description = entry.title_detail.value
+            content_value = None
+            content = entry.summary_detail.value
+        else:
+            title = entry.title
+            description = entry.description
+            if self.description_falls_back_to_title and description == '':
+                description = entry.title
+            content_value = entry.content[0].value if entry.get('content') else None
+            content = html_to_text(content_value) if content_value else None
+
+        image_url = self.extract_image(entry, content_value)
+        if image_url and self.image_rewrite:
+            image_url = self.image_rewrite(image_url)
+        if not image_url and self.generate_missing_image:
+            image_url = generateImage.generate_image_url_from_text(entry.title)
+
+        return {
+            "title": title,
+            "description": description,
+            "content": content,
+            "link": entry.link,
+            "pubDate": entry.published,
+            "category": self.category if self.category is not None else entry.category,
+            "image": image_url,
+            "publisher": self.publisher
+        }
+
+
+SOURCES: List[FeedSpec] = [
+    # International
+    FeedSpec("un_news", "UN News", "UN_NEWS", 'UN News', "international",
+             SUMMARY_BODY, ENCLOSURE_IMAGE, category="News"),
+    FeedSpec("toi_news", "Times of India News", "TOI_NEWS", 'Times of India', "international",
+             SUMMARY_BODY, ENCLOSURE_IMAGE, category="News", image_rewrite=toi_image),
+    FeedSpec("the_hindu_international", "The Hindu International News", "THE_HINDU_INTERNATIONAL",
+             'The Hindu International', "international", SUMMARY_BODY, MEDIA_CONTENT_IMAGE, category="International"),
+    FeedSpec("nyt_world", "NYT World News", "NYT_WORLD", 'The New York Times World', "international",
+             SUMMARY_BODY, MEDIA_CONTENT_IMAGE, category="World"),
+
+    # Sports
+    FeedSpec("the_hindu_sports", "The Hindu Sports", "THE_HINDU_SPORTS", 'The Hindu Sports', "sports",
+             SUMMARY_BODY, MEDIA_CONTENT_IMAGE, category="Sports"),
+    FeedSpec("the_himalayan_times_sports", "The Himalayan Times Sports", "THE_HIMALAYAN_TIMES_SPORTS",
+             'The Himalayan Times Sports', "sports", SUMMARY_BODY, MEDIA_THUMBNAIL_IMAGE, category="Sports"),
+
+    # Tech
+    FeedSpec("toi_tech", "Times of India Tech", "TOI_TECH", 'Times of India Tech', "tech",
+             SUMMARY_BODY, ENCLOSURE_IMAGE, category="Technology", image_rewrite=toi_image),
+    FeedSpec("tech_crunch", "TechCrunch", "TECH_CRUNCH", 'TechCrunch', "tech",
+             SUMMARY_BODY, MEDIA_THUMBNAIL_IMAGE, category="Technology"),
+
+    # Nepali news in English
+    FeedSpec("online_khabar_en", "Online Khabar English", "ONLINE_KHABAR_EN", 'Online Khabar', "nepali_en",
+             CONTENT_HTML_BODY, r'(https?://\S+\.jpg)', image_rewrite=replace_all(("http", "https"), ("httpss", "https")),
+             generate_missing_image=True),
+    FeedSpec("nepal_news_en", "Nepal News English", "NEPAL_NEWS_EN", 'Nepal News', "nepali_en",
+             CONTENT_HTML_BODY, r'(https?://[^\s]+\.jpg)', image_rewrite=replace_all(('/768/', '/1024/'), ('_768', '_1024')),
+             description_falls_back_to_title=True),
+    FeedSpec("the_himalayan_en", "The Himalayan Times English", "THE_HIMALAYAN_EN", 'THE HIMALAYAN TIMES', "nepali_en",
+             SUMMARY_BODY, MEDIA_THUMBNAIL_IMAGE, category="News"),
+
+    # Nepali news in Nepali
+    FeedSpec("online_khabar_np", "Online Khabar Nepali", "ONLINE_KHABAR_NP", 'Online Khabar', "nepali_np",
+             CONTENT_HTML_BODY, r'(https?://\S+\.jpg)', generate_missing_image=True),
+    FeedSpec("our_biratnagar_np", "OB News Nepali", "OUR_BIRATNAGAR_NP", 'Our Biratnagar', "nepali_np",
+             CONTENT_HTML_BODY, r'(https?://[^\s]+\.jpeg)'),
+    FeedSpec("nagarik_np", "Nagarik News Nepali", "NAGRIK_NEWS", 'Nagarik News', "nepali_np",
+             CONTENT_HTML_BODY, r'(https?://[^\s]+\.jpg)', category='news'),
+    FeedSpec("rajdhani_daily_np", "Rajdhani Daily Nepali", "RAJDHANI_DAILY", 'Rajdhani Daily', "nepali_np",
+             CONTENT_HTML_BODY, r'(https?://[^\s]+(?:\.jpeg|\.jpg))'),
+    FeedSpec("news_of_nepal_np", "News of Nepal Nepali", "NEWS_OF_NEPAL", 'News Of Nepal', "nepali_np",
+             CONTENT_HTML_BODY, r'(https?://[^\s]+(?:\.jpeg|\.jpg))', image_rewrite=replace_all(("-150x150", ""))),
+]
+
+_SOURCES_BY_KEY: Dict[str, FeedSpec] = {spec.key: spec for spec in SOURCES}
+
+
+def get_source(key: str) -> FeedSpec:
+    return _SOURCES_BY_KEY[key]
+
+
+def sources_for(*groups: str) -> List[FeedSpec]:
+    """All sources in the given groups, in registry order"""
+    return [spec for spec in SOURCES if spec.group in groups]
+
+
+def parse_feed(spec: FeedSpec, raw=None) -> List[Dict[str, Any]]:
+    """
+    Parse a feed document into news items
+
+    Args:
+        spec (FeedSpec): The source being parsed
+        raw (bytes): Downloaded feed; when omitted the feed URL is fetched by feedparser
+
+    Returns:
+        list: News item dicts
+    """
+    import feedparser
+
+    try:
+        feed = feedparser.parse(raw if raw is not None else spec.url)
+        return [spec.build_item(entry) for entry in feed.entries]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching {spec.name} news: {str(e)}")
+
+
+def parse_source(key: str, raw=None) -> List[Dict[str, Any]]:
+    return parse_feed(get_source(key), raw)
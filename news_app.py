@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 from controller import subscriber_controller, news_controller  # Import routers from controllers
 from controller import ai_controller, international_news_controller, sports_news_controller, tech_news_controller, nepali_news_controller
+from controller import metrics_controller
+from db.db_connection import dispose_async_engine
+from newsFeeds.parse_pool import shutdown_parse_pool
+from service.llm_service import close_async_clients, close_clients
 
 app = FastAPI()
 
@@ -12,6 +16,23 @@ app.include_router(international_news_controller.router)
 app.include_router(sports_news_controller.router)
 app.include_router(tech_news_controller.router)
 app.include_router(nepali_news_controller.router)
+app.include_router(metrics_controller.router)
+
+
+@app.on_event("shutdown")
+def stop_parse_workers():
+    shutdown_parse_pool()
+
+
+@app.on_event("shutdown")
+async def close_async_db():
+    await dispose_async_engine()
+
+
+@app.on_event("shutdown")
+async def close_llm_clients():
+    await close_async_clients()
+    close_clients()
 
 
 # Root route
@@ -40,7 +40,9 @@ def recreate_news_table():
                     description TEXT,
                     content TEXT,
                     link VARCHAR(1000),
+                    link_hash VARCHAR(64) NOT NULL,
                     pub_date VARCHAR(255),
+                    published_at TIMESTAMP WITH TIME ZONE NOT NULL,
                     category VARCHAR(100),
                     image VARCHAR(1000),
                     publisher VARCHAR(200),
@@ -48,7 +50,8 @@ def recreate_news_table():
                     summary TEXT,
                     is_summarized BOOLEAN DEFAULT FALSE,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    CONSTRAINT uq_news_tag_link_hash UNIQUE (tag, link_hash)
                 );
             """))
             
@@ -57,6 +60,9 @@ def recreate_news_table():
             conn.execute(text("CREATE INDEX idx_news_title ON news(title);"))
             conn.execute(text("CREATE INDEX idx_news_tag ON news(tag);"))
             conn.execute(text("CREATE INDEX idx_news_pub_date ON news(pub_date);"))
+            conn.execute(text("CREATE INDEX ix_news_tag_published_at ON news(tag, published_at DESC, id DESC);"))
+            conn.execute(text("CREATE INDEX ix_news_tag_published_at_summarized ON news(tag, published_at DESC, id DESC) WHERE is_summarized;"))
+            conn.execute(text("CREATE INDEX ix_news_tag_created_at ON news(tag, created_at DESC);"))
             
             print("✅ News table created successfully")
             
@@ -0,0 +1,188 @@
+"""
+Input condensation before LLM calls
+Article text goes to the model as description + content with no size limit. Long articles
+(Nepali ones especially, which take several tokens per word) inflate prompt cost and latency
+and can exceed the model's context. condense() runs before every summary prompt:
+
+1. drops feed boilerplate ("Read more", "The post ... appeared first on ...") and whole paragraphs
+   repeated verbatim, such as a description that the content opens with. Paragraphs are separated
+   by blank lines; a single line break is whitespace, because html_to_text puts every inline run
+   (<a>, <strong>, ...) on its own line;
+2. estimates the token count;
+3. trims to the model's budget at paragraph, then sentence, boundaries. The opening of a news
+   article carries the story, so the end is cut.
+
+Token counts are estimates (no tokenizer is shipped for the router's models): ASCII text is taken
+as ~4 characters per token, other scripts as ~1.5, which is on the safe side for Devanagari.
+"""
+
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+from service.llm_metrics import CONDENSE_METRICS
+
+_CHARS_PER_TOKEN_ASCII = 4.0
+_CHARS_PER_TOKEN_OTHER = 1.5
+
+# Input token budget for summaries; SUMMARY_INPUT_TOKEN_BUDGETS overrides it per model,
+# e.g. "openai/gpt-oss-20b:fireworks-ai=3000,meta-llama/Llama-3.1-8B-Instruct=1500"
+SUMMARY_INPUT_TOKEN_BUDGET = int(os.getenv("SUMMARY_INPUT_TOKEN_BUDGET", "1500"))
+
+
+def _parse_budgets(value: str) -> Dict[str, int]:
+    budgets = {}
+    for item in value.split(","):
+        model, _, tokens = item.strip().rpartition("=")
+        if model and tokens.strip().isdigit():
+            budgets[model.strip()] = int(tokens)
+    return budgets
+
+
+_MODEL_BUDGETS = _parse_budgets(os.getenv("SUMMARY_INPUT_TOKEN_BUDGETS", ""))
+
+# Whole paragraphs that are feed or site furniture rather than article text. Each alternative is
+# an exact phrase (with optional trailing arrows or dots) or length-capped, so article sentences
+# that merely start with "Copyright", "Share" or "Read more" are kept.
+_TRAILER = r"\s*(?:\.{3}|…|»|→|>>|\[…\]|\[\.\.\.\])?\.?"
+_BOILERPLATE = re.compile(
+    r"^(?:"
+    r"the post .{1,200} appeared first on [^.]{1,80}\."
+    r"|(?:continue reading|read more|read the full (?:story|article)|read full (?:story|article))(?: here)?"
+    + _TRAILER +
+    r"|click here(?: to read more| for more)?" + _TRAILER +
+    r"|(?:follow|like) us on (?:facebook|twitter|x|instagram|youtube)(?:,? and (?:facebook|twitter|x|instagram|youtube))?\.?"
+    r"|subscribe to our (?:newsletter|channel)\.?"
+    r"|share (?:this (?:article|story|post)|on (?:facebook|twitter|x|whatsapp|linkedin))\.?"
+    r"|advertisement|sponsored|related(?: news| articles| stories)?:?"
+    r"|(?:copyright|©|\(c\)) ?(?:©\s?)?\d{4}(?:[-–]\d{4})?\b.{0,60}|all rights reserved\.?"
+    r"|थप पढ्नुहोस्" + _TRAILER + r"|पूरा समाचार पढ्नुहोस्" + _TRAILER + r"|विज्ञापन"
+    r")$",
+    re.IGNORECASE,
+)
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+_WHITESPACE = re.compile(r"\s+")
+# Sentence ends in English and Nepali (। is the Devanagari danda)
+_SENTENCE_END = re.compile(r"(?<=[.!?।])\s+")
+# Shorter paragraphs (names, datelines, headings) may repeat legitimately and are never deduplicated
+_MIN_DEDUPE_CHARS = 40
+
+
+class CondensedText:
+    """
+    Result of condense()
+
+    Args:
+        text (str): Text to send to the model
+        tokens_before (int): Estimated tokens of the original text
+        tokens_after (int): Estimated tokens of text
+    """
+
+    def __init__(self, text: str, tokens_before: int, tokens_after: int):
+        self.text = text
+        self.tokens_before = tokens_before
+        self.tokens_after = tokens_after
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+def estimate_tokens(text: str) -> int:
+    ascii_chars = sum(1 for char in text if char < "\x80")
+    other_chars = len(text) - ascii_chars
+    return int(ascii_chars / _CHARS_PER_TOKEN_ASCII + other_chars / _CHARS_PER_TOKEN_OTHER + 0.999)
+
+
+def token_budget(model: Optional[str]) -> int:
+    return _MODEL_BUDGETS.get(model or "", SUMMARY_INPUT_TOKEN_BUDGET)
+
+
+def _paragraph_key(paragraph: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", paragraph)).strip().casefold()
+
+
+def dedupe_paragraphs(text: str) -> List[str]:
+    """Paragraphs of text in order, whitespace collapsed, without boilerplate and repeated paragraphs"""
+    paragraphs: List[str] = []
+    keys: List[str] = []
+    for paragraph in _PARAGRAPH_SPLIT.split(text):
+        key = _paragraph_key(paragraph)
+        if not key or _BOILERPLATE.match(key):
+            continue
+        if len(key) >= _MIN_DEDUPE_CHARS:
+            if key in keys:
+                continue
+            # A description that the content opens with is dropped; the content keeps every word
+            if keys and len(keys[-1]) >= _MIN_DEDUPE_CHARS and key.startswith(keys[-1]):
+                paragraphs.pop()
+                keys.pop()
+        paragraphs.append(_WHITESPACE.sub(" ", paragraph).strip())
+        keys.append(key)
+    return paragraphs
+
+
+def _cut(paragraph: str, budget: int) -> str:
+    """Leading sentences of paragraph within budget; a hard cut when even one sentence is too long"""
+    kept = ""
+    for sentence in _SENTENCE_END.split(paragraph):
+        candidate = f"{kept} {sentence}".strip()
+        if estimate_tokens(candidate) > budget:
+            break
+        kept = candidate
+    if kept:
+        return kept
+    # Shrink by characters; the estimate is monotonic in length
+    low, high = 0, len(paragraph)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(paragraph[:middle]) <= budget:
+            low = middle
+        else:
+            high = middle - 1
+    return paragraph[:low].rstrip()
+
+
+def condense(text: str, model: Optional[str] = None, budget: Optional[int] = None) -> CondensedText:
+    """
+    Condense article text for a summary prompt
+
+    Args:
+        text (str): Article text, e.g. description and content joined by a blank line
+        model (str): Model the text is for; selects the token budget
+        budget (int): Explicit token budget, overriding the model's
+
+    Returns:
+        CondensedText; its text is empty only for blank input
+    """
+    budget = token_budget(model) if budget is None else budget
+    tokens_before = estimate_tokens(text)
+
+    kept: List[str] = []
+    used = 0
+    trimmed = False
+    # Input that is nothing but boilerplate is sent as it is rather than as an empty prompt
+    paragraphs = dedupe_paragraphs(text) or [_WHITESPACE.sub(" ", text).strip()]
+    for paragraph in paragraphs:
+        # Paragraphs are joined by a blank line, about one token
+        cost = estimate_tokens(paragraph) + (1 if kept else 0)
+        if used + cost > budget:
+            remaining = budget - used - (1 if kept else 0)
+            if remaining > 0:
+                partial = _cut(paragraph, remaining)
+                if partial:
+                    kept.append(partial)
+            trimmed = True
+            break
+        kept.append(paragraph)
+        used += cost
+
+    condensed = "\n\n".join(kept)
+    result = CondensedText(condensed, tokens_before, estimate_tokens(condensed))
+    CONDENSE_METRICS.observe(result, trimmed)
+    # Every call is counted in CONDENSE_METRICS (/metrics/llm); only cuts to the budget are logged
+    if trimmed:
+        print(f"✂️  Trimmed summary input to the budget: ~{result.tokens_before} → ~{result.tokens_after} tokens")
+    return result
@@ -0,0 +1,37 @@
+"""
+JSON encoding for cached response bodies
+Cached payloads are encoded once per refresh and the bytes are sent as-is on every hit, so the
+encoder runs off the request path. orjson is used when installed (several times faster than the
+json module and returns bytes directly); json is the fallback. Both produce compact UTF-8 with
+non-ASCII text kept as-is and datetimes in ISO 8601, as FastAPI's own encoder does.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    """Encode value as compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data: Union[bytes, memoryview]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
@@ -0,0 +1,81 @@
+"""
+HTTP conditional responses
+List endpoints compute a cheap version of their result (a content hash computed once per cache
+refresh, or count/max(id)/max(updated_at) for database lists), send it as ETag and the time it
+last changed as Last-Modified, and answer If-None-Match / If-Modified-Since with 304 before
+running the full query or serializing anything.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+# Clients may keep a copy but must revalidate it on every use
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Weak ETag over the given version components"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def body_etag(body: bytes) -> str:
+    """Weak ETag over an encoded response body"""
+    return f'W/"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Database timestamps are naive UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Whether the client's cached copy is still current
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted without it (RFC 9110)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/ prefixes are ignored
+        wanted = etag[2:] if etag.startswith("W/") else etag
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if (candidate[2:] if candidate.startswith("W/") else candidate) == wanted:
+                return True
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag, last_modified))
+
+
+def set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime] = None):
+    response.headers.update(cache_headers(etag, last_modified))
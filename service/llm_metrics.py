@@ -0,0 +1,181 @@
+"""
+LLM request metrics
+- How much prompt text the condensation stage (service/condense.py) removes before each summary
+  request, so prompt cost and latency can be tracked.
+- Per-model latency, failures and hedging outcomes. The recent latency window also drives the
+  hedge delay in service/model_router.py.
+Exposed by controller/metrics_controller.py next to the pool metrics.
+"""
+
+import math
+import os
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+from db.pool_metrics import Histogram, histogram_lines
+
+# Estimated tokens per summary input
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 1500, 2000, 3000, 4000, 6000, 8000, 16000, 32000)
+
+
+class CondenseMetrics:
+    """Totals and per-request distributions of estimated input tokens before and after condensing"""
+
+    def __init__(self):
+        self.requests = 0
+        self.trimmed = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self.input_tokens = Histogram(TOKEN_BUCKETS)
+        self.tokens_saved = Histogram(TOKEN_BUCKETS)
+        self._lock = threading.Lock()
+
+    def observe(self, result, trimmed: bool):
+        """Record one condense() result"""
+        with self._lock:
+            self.requests += 1
+            self.trimmed += 1 if trimmed else 0
+            self.tokens_before += result.tokens_before
+            self.tokens_after += result.tokens_after
+        self.input_tokens.observe(result.tokens_after)
+        self.tokens_saved.observe(result.tokens_saved)
+
+    def as_dict(self) -> Dict[str, object]:
+        with self._lock:
+            totals = {
+                "requests": self.requests,
+                "trimmed": self.trimmed,
+                "tokens_before": self.tokens_before,
+                "tokens_after": self.tokens_after,
+                "tokens_saved": self.tokens_before - self.tokens_after,
+            }
+        return {
+            **totals,
+            "input_tokens": self.input_tokens.snapshot(),
+            "tokens_saved_per_request": self.tokens_saved.snapshot(),
+        }
+
+
+CONDENSE_METRICS = CondenseMetrics()
+
+# Recent latencies kept per model for quantiles; fewer than LLM_LATENCY_MIN_SAMPLES gives no quantile
+LLM_LATENCY_WINDOW = int(os.getenv("LLM_LATENCY_WINDOW", "200"))
+LLM_LATENCY_MIN_SAMPLES = int(os.getenv("LLM_LATENCY_MIN_SAMPLES", "20"))
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0)
+
+
+class ModelStats:
+    """Latency and outcome counters for one model"""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.requests = 0
+        self.failures = 0
+        self.hedges = 0  # Requests sent because an earlier model was slower than its hedge delay
+        self.hedge_wins = 0  # Hedged requests that answered first
+        self.latency_seconds = Histogram(LATENCY_BUCKETS)
+        self._recent = deque(maxlen=LLM_LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def started(self, hedge: bool = False):
+        with self._lock:
+            self.requests += 1
+            self.hedges += 1 if hedge else 0
+
+    def succeeded(self, seconds: float, hedge: bool = False):
+        self.latency_seconds.observe(seconds)
+        with self._lock:
+            self._recent.append(seconds)
+            self.hedge_wins += 1 if hedge else 0
+
+    def abandoned(self, seconds: float):
+        """A request cancelled after another answered: it took at least this long"""
+        with self._lock:
+            self._recent.append(seconds)
+
+    def failed(self):
+        with self._lock:
+            self.failures += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        with self._lock:
+            recent = sorted(self._recent)
+        if len(recent) < LLM_LATENCY_MIN_SAMPLES:
+            return None
+        return recent[max(math.ceil(q * len(recent)) - 1, 0)]
+
+    def as_dict(self) -> Dict[str, object]:
+        with self._lock:
+            counters = {
+                "requests": self.requests,
+                "failures": self.failures,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+            }
+        return {
+            **counters,
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "latency_seconds": self.latency_seconds.snapshot(),
+        }
+
+
+MODEL_STATS: Dict[str, ModelStats] = {}
+_model_stats_lock = threading.Lock()
+
+
+def model_stats(model: str) -> ModelStats:
+    with _model_stats_lock:
+        stats = MODEL_STATS.get(model)
+        if stats is None:
+            stats = MODEL_STATS[model] = ModelStats(model)
+        return stats
+
+
+def render_prometheus() -> str:
+    """LLM metrics in the Prometheus text exposition format"""
+    metrics = CONDENSE_METRICS.as_dict()
+    lines: List[str] = []
+    counters = {
+        "llm_condense_requests_total": ("Summary inputs passed through condensation", "requests"),
+        "llm_condense_trimmed_total": ("Summary inputs cut to the token budget", "trimmed"),
+        "llm_condense_tokens_before_total": ("Estimated input tokens before condensation", "tokens_before"),
+        "llm_condense_tokens_after_total": ("Estimated input tokens sent to the model", "tokens_after"),
+        "llm_condense_tokens_saved_total": ("Estimated input tokens removed by condensation", "tokens_saved"),
+    }
+    for metric, (description, key) in counters.items():
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {metrics[key]}")
+
+    histograms = {
+        "llm_condense_input_tokens": ("Estimated input tokens per summary request", CONDENSE_METRICS.input_tokens),
+        "llm_condense_tokens_saved": ("Estimated tokens removed per summary request", CONDENSE_METRICS.tokens_saved),
+    }
+    for metric, (description, histogram) in histograms.items():
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} histogram")
+        lines.extend(histogram_lines(metric, "", histogram))
+
+    model_counters = {
+        "llm_requests_total": ("Requests sent per model, hedges included", "requests"),
+        "llm_failures_total": ("Requests per model that raised an error", "failures"),
+        "llm_hedges_total": ("Hedged requests sent per model", "hedges"),
+        "llm_hedge_wins_total": ("Hedged requests per model that answered first", "hedge_wins"),
+    }
+    with _model_stats_lock:
+        stats_list = list(MODEL_STATS.values())
+    for metric, (description, attribute) in model_counters.items():
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} counter")
+        for stats in stats_list:
+            lines.append(f'{metric}{{model="{stats.model}"}} {getattr(stats, attribute)}')
+
+    lines.append("# HELP llm_request_seconds Latency of answered requests per model")
+    lines.append("# TYPE llm_request_seconds histogram")
+    for stats in stats_list:
+        lines.extend(histogram_lines("llm_request_seconds", f'model="{stats.model}"', stats.latency_seconds))
+
+    return "\n".join(lines) + "\n"
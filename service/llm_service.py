@@ -1,8 +1,17 @@
+import asyncio
+import json
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import weakref
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Any, Optional, Tuple
 
 from dotenv import load_dotenv
-from openai import OpenAI
+
+from service.condense import condense
+from service.model_router import MODEL_CHAIN, route, route_sync
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
 
 # Ensure .env is loaded for local/dev environments
@@ -11,20 +20,141 @@ load_dotenv()
 
 _HF_TOKEN_ENV_KEY = "HF_TOKEN"
 _HF_ROUTER_BASE_URL = "https://router.huggingface.co/v1"
+# Any OpenAI-compatible endpoint, e.g. the offline stub in benchmarks/llm_stub_server.py
+LLM_BASE_URL = os.getenv("LLM_BASE_URL", _HF_ROUTER_BASE_URL)
+
+# First model of LLM_MODEL_CHAIN; the rest are fallbacks (service/model_router.py)
+DEFAULT_MODEL = MODEL_CHAIN[0]
 
+# HTTP settings shared by every LLM client. Clients are cached per (token, base URL), so their
+# connections stay open between calls and only the first call pays for the TLS handshake.
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))  # Read/write/pool timeout of one request
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "10"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))  # Retries done by the SDK itself
 
-def _get_openai_client(explicit_token: Optional[str] = None) -> OpenAI:
+_clients: Dict[Tuple[str, str], "OpenAI"] = {}
+# Async clients hold connections bound to the event loop that opened them, so they are cached per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncOpenAI]]" = \
+    weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def _resolve_token(explicit_token: Optional[str]) -> str:
     token = explicit_token or os.getenv(_HF_TOKEN_ENV_KEY)
     if not token:
         raise RuntimeError(
             f"Environment variable '{_HF_TOKEN_ENV_KEY}' is required but was not found."
         )
-    return OpenAI(base_url=_HF_ROUTER_BASE_URL, api_key=token)
+    return token
+
+
+def _http_options() -> Dict[str, Any]:
+    import httpx
+
+    return {
+        "timeout": httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        ),
+    }
+
+
+def _get_openai_client(explicit_token: Optional[str] = None) -> "OpenAI":
+    """Process-wide OpenAI client for the token, created on first use"""
+    # Imported lazily: the SDK is heavy and only needed once an AI endpoint is actually used
+    from openai import DefaultHttpxClient, OpenAI
+
+    key = (_resolve_token(explicit_token), LLM_BASE_URL)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OpenAI(
+                base_url=key[1], api_key=key[0], max_retries=LLM_MAX_RETRIES,
+                http_client=DefaultHttpxClient(**_http_options()),
+            )
+            _clients[key] = client
+    return client
+
+
+def _get_async_openai_client(explicit_token: Optional[str] = None) -> "AsyncOpenAI":
+    """AsyncOpenAI client for the token on the running event loop, created on first use"""
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    key = (_resolve_token(explicit_token), LLM_BASE_URL)
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(
+                base_url=key[1], api_key=key[0], max_retries=LLM_MAX_RETRIES,
+                http_client=DefaultAsyncHttpxClient(**_http_options()),
+            )
+            clients[key] = client
+    return client
+
+
+async def close_async_clients():
+    """Close the async clients of the running event loop; call before the loop ends"""
+    with _clients_lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def close_clients():
+    """Close the cached sync clients and their connections"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def _completion_params(messages, model, temperature, max_tokens, top_p) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+    }
+    if max_tokens is not None:
+        params["max_tokens"] = max_tokens
+    if top_p is not None:
+        params["top_p"] = top_p
+    return params
+
+
+def _completion_result(completion, model: str) -> Dict[str, Any]:
+    # Normalize to a convenient shape for callers in our app
+    choice = completion.choices[0].message if completion and completion.choices else None
+    return {
+        "id": getattr(completion, "id", None),
+        "model": getattr(completion, "model", model),
+        "usage": getattr(completion, "usage", None),
+        "message": choice,
+        "raw": completion,
+    }
+
+
+def _message_content(result: Dict[str, Any]) -> str:
+    message = result.get("message")
+    # Handle both dict and ChatCompletionMessage objects
+    if hasattr(message, 'content'):
+        return message.content
+    elif isinstance(message, dict):
+        return message.get("content", "")
+    else:
+        return ""
 
 
 def chat_completion(
     messages: List[Dict[str, str]],
-    model: str = "openai/gpt-oss-20b:fireworks-ai",
+    model: str = DEFAULT_MODEL,
     temperature: float = 0.2,
     max_tokens: Optional[int] = None,
     top_p: Optional[float] = None,
@@ -32,6 +162,8 @@ def chat_completion(
 ) -> Dict[str, Any]:
     """Call the HF router using OpenAI SDK chat.completions API shape.
 
+    Requests for the default model fall back to the rest of LLM_MODEL_CHAIN on errors.
+
     Args:
         messages: List of {"role": "user|system|assistant", "content": str}
         model: Model identifier as expected by the HF router
@@ -45,55 +177,93 @@ def chat_completion(
     """
     try:
         client = _get_openai_client(explicit_token)
-        
-        params: Dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-        }
-        if max_tokens is not None:
-            params["max_tokens"] = max_tokens
-        if top_p is not None:
-            params["top_p"] = top_p
-        
-        completion = client.chat.completions.create(**params)
-        
-        # Normalize to a convenient shape for callers in our app
-        choice = completion.choices[0].message if completion and completion.choices else None
-        
-        result = {
-            "id": getattr(completion, "id", None),
-            "model": getattr(completion, "model", model),
-            "usage": getattr(completion, "usage", None),
-            "message": choice,
-            "raw": completion,
-        }
-        return result
+        completion = route_sync(
+            lambda name: client.chat.completions.create(
+                **_completion_params(messages, name, temperature, max_tokens, top_p)
+            ),
+            model,
+        )
+        return _completion_result(completion, model)
     except Exception as e:
         print(f"ERROR in chat_completion: {e}")
         raise
 
 
-def ask_plaintext(prompt: str, model: str = "openai/gpt-oss-20b:fireworks-ai") -> str:
+async def achat_completion(
+    messages: List[Dict[str, str]],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.2,
+    max_tokens: Optional[int] = None,
+    top_p: Optional[float] = None,
+    explicit_token: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Async chat_completion, on the shared AsyncOpenAI client of the running loop.
+
+    Requests for the default model are hedged and fall back along LLM_MODEL_CHAIN.
+    """
+    try:
+        client = _get_async_openai_client(explicit_token)
+        completion = await route(
+            lambda name: client.chat.completions.create(
+                **_completion_params(messages, name, temperature, max_tokens, top_p)
+            ),
+            model,
+        )
+        return _completion_result(completion, model)
+    except Exception as e:
+        print(f"ERROR in achat_completion: {e}")
+        raise
+
+
+async def astream_chat_completion(
+    messages: List[Dict[str, str]],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.2,
+    max_tokens: Optional[int] = None,
+    top_p: Optional[float] = None,
+    explicit_token: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """Async chat completion that yields content deltas as the model produces them."""
+    client = _get_async_openai_client(explicit_token)
+    # Routed until the response headers arrive; the model that opened its stream first is read
+    stream = await route(
+        lambda name: client.chat.completions.create(
+            stream=True, **_completion_params(messages, name, temperature, max_tokens, top_p)
+        ),
+        model,
+        discard=lambda unused: unused.close(),
+    )
+    try:
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+    finally:
+        # Releases the connection when the client disconnects mid-stream
+        await stream.close()
+
+
+def ask_plaintext(prompt: str, model: str = DEFAULT_MODEL) -> str:
     """Convenience helper that returns assistant message content as string."""
     try:
         result = chat_completion(messages=[{"role": "user", "content": prompt}], model=model)
-        message = result.get("message")
-        
-        # Handle both dict and ChatCompletionMessage objects
-        if hasattr(message, 'content'):
-            # It's a ChatCompletionMessage object
-            return message.content
-        elif isinstance(message, dict):
-            # It's a dict
-            return message.get("content", "")
-        else:
-            return ""
+        return _message_content(result)
     except Exception as e:
         print(f"ERROR in ask_plaintext: {e}")
         raise
 
 
+async def aask_plaintext(prompt: str, model: str = DEFAULT_MODEL) -> str:
+    """Async ask_plaintext."""
+    try:
+        result = await achat_completion(messages=[{"role": "user", "content": prompt}], model=model)
+        return _message_content(result)
+    except Exception as e:
+        print(f"ERROR in aask_plaintext: {e}")
+        raise
+
+
 def detect_language(text: str) -> str:
     """Simple language detection based on character sets."""
     # Check for Nepali characters (Devanagari script)
@@ -109,9 +279,7 @@ def detect_language(text: str) -> str:
         return "english"
 
 
-def summarize_news(news_content: str, model: str = "openai/gpt-oss-20b:fireworks-ai") -> str:
-    """Generate a 60-word news summary using the professional news summarizer system prompt."""
-    system_prompt = """You are a master news summarizer and headline writer whose mission is to create exactly 60 words that are impossible to ignore for a user to open and read the full story. Your summaries must:
+_SUMMARY_SYSTEM_PROMPT = """You are a master news summarizer and headline writer whose mission is to create exactly 60 words that are impossible to ignore for a user to open and read the full story. Your summaries must:
 
 1. **HOOK the reader immediately** with a compelling opening that creates curiosity
 2. **REVEAL the core story** with enough detail to inform but not satisfy completely
@@ -130,28 +298,115 @@ def summarize_news(news_content: str, model: str = "openai/gpt-oss-20b:fireworks
 Your goal: Make every reader think "I MUST read the full story NOW!"
 
 IMPORTANT: Detect the language of the input news content and respond in the SAME language. If the input is in Nepali (नेपाली), respond in Nepali. If the input is in English, respond in English. If the input is in any other language, respond in that language."""
-    
+
+# Appended to the summary prompt when several articles share one request
+_BATCH_SYSTEM_PROMPT = _SUMMARY_SYSTEM_PROMPT + """
+
+You will receive several articles, each wrapped in <article id="N"> ... </article>. Summarize every article separately, following all the rules above for each one, and answer ONLY with JSON in exactly this shape, one entry per article, with no other text:
+{"summaries": [{"id": 1, "summary": "..."}, {"id": 2, "summary": "..."}]}"""
+
+
+def _summary_messages(news_content: str, model: Optional[str] = None) -> List[Dict[str, str]]:
+    news_content = condense(news_content, model).text
     user_prompt = f"Transform this news article into exactly 60 words that will convince ANY reader to click and read the full story. Make it irresistible and impossible to ignore:\n\n{news_content}"
-    
+    return [
+        {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def summarize_news(news_content: str, model: str = DEFAULT_MODEL) -> str:
+    """Generate a 60-word news summary using the professional news summarizer system prompt."""
     try:
-        result = chat_completion(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            model=model
-        )
-        message = result.get("message")
-        
-        # Handle both dict and ChatCompletionMessage objects
-        if hasattr(message, 'content'):
-            return message.content
-        elif isinstance(message, dict):
-            return message.get("content", "")
-        else:
-            return ""
+        result = chat_completion(messages=_summary_messages(news_content, model), model=model)
+        return _message_content(result)
     except Exception as e:
         print(f"ERROR in summarize_news: {e}")
         raise
 
 
+async def asummarize_news(news_content: str, model: str = DEFAULT_MODEL) -> str:
+    """Async summarize_news."""
+    try:
+        result = await achat_completion(messages=_summary_messages(news_content, model), model=model)
+        return _message_content(result)
+    except Exception as e:
+        print(f"ERROR in asummarize_news: {e}")
+        raise
+
+
+def astream_summary(news_content: str, model: str = DEFAULT_MODEL) -> AsyncIterator[str]:
+    """summarize_news streamed as content deltas."""
+    return astream_chat_completion(messages=_summary_messages(news_content, model), model=model)
+
+
+def _batch_summary_messages(articles: List[str], model: Optional[str] = None) -> List[Dict[str, str]]:
+    # Each article gets the same budget it would have in a single-article request
+    packed = "\n\n".join(
+        f'<article id="{index}">\n{condense(article, model).text}\n</article>'
+        for index, article in enumerate(articles, start=1)
+    )
+    return [
+        {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+        {"role": "user", "content": f"Summarize each of these {len(articles)} articles:\n\n{packed}"},
+    ]
+
+
+def _batch_entries(text: str) -> Optional[List[Any]]:
+    """The summary list of the first JSON value in text that has one; objects are tried before bare lists"""
+    decoder = json.JSONDecoder()
+    for opening in ("{", "["):
+        start = text.find(opening)
+        while start >= 0:
+            try:
+                parsed, _ = decoder.raw_decode(text, start)
+            except ValueError:
+                parsed = None
+            entries = parsed.get("summaries") if isinstance(parsed, dict) else parsed
+            if isinstance(entries, list):
+                return entries
+            start = text.find(opening, start + 1)
+    return None
+
+
+def parse_batch_summaries(text: str, count: int) -> List[Optional[str]]:
+    """
+    Split a batch completion back into per-article summaries
+
+    Accepts {"summaries": [...]} or a bare list of {"id", "summary"} entries, optionally wrapped
+    in a Markdown code fence or surrounded by other text.
+
+    Returns:
+        list: One entry per article in request order; None where the output has no usable summary
+    """
+    summaries: List[Optional[str]] = [None] * count
+    entries = _batch_entries(text)
+    if entries is None:
+        return summaries
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            index = int(entry.get("id")) - 1
+        except (TypeError, ValueError):
+            continue
+        summary = entry.get("summary")
+        if 0 <= index < count and isinstance(summary, str) and summary.strip() and summaries[index] is None:
+            summaries[index] = summary.strip()
+    return summaries
+
+
+async def asummarize_news_batch(articles: List[str], model: str = DEFAULT_MODEL) -> List[Optional[str]]:
+    """
+    Summarize several articles with one request, so the system prompt is sent once
+
+    Returns:
+        list: Summaries in article order; None for articles the response did not cover, which
+        callers should summarize on their own
+    """
+    try:
+        result = await achat_completion(messages=_batch_summary_messages(articles, model), model=model)
+        return parse_batch_summaries(_message_content(result) or "", len(articles))
+    except Exception as e:
+        print(f"ERROR in asummarize_news_batch: {e}")
+        raise
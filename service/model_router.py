@@ -0,0 +1,151 @@
+"""
+Model routing with fallback and hedged requests
+LLM_MODEL_CHAIN is an ordered list of models; the first is the primary (DEFAULT_MODEL). A call for
+the primary goes through route():
+
+- when a model fails, the next one in the chain is asked straight away;
+- when a model has not answered within its hedge delay (the LLM_HEDGE_QUANTILE of its recent
+  latencies, p95 by default), the next model is asked as well and whichever answers first wins;
+  the slower request is cancelled.
+
+So a slow or failing provider costs one hedge delay instead of the full request timeout, while
+hedges stay rare: by construction only about 1 in 20 requests outlives the p95. Until a model has
+LLM_LATENCY_MIN_SAMPLES answers, LLM_HEDGE_DEFAULT_DELAY stands in for its p95. Latencies and
+outcomes are recorded per model in service/llm_metrics.py.
+
+Calls for a model outside the chain's primary are sent to that model only.
+"""
+
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from service.llm_metrics import model_stats
+
+T = TypeVar("T")
+
+MODEL_CHAIN: List[str] = [
+    model.strip()
+    for model in os.getenv("LLM_MODEL_CHAIN", "openai/gpt-oss-20b:fireworks-ai").split(",")
+    if model.strip()
+]
+
+LLM_HEDGING = os.getenv("LLM_HEDGING", "true").lower() == "true"
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.95"))
+# Hedge delay while a model has too few samples, and the lowest delay ever used
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "8"))
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "0.25"))
+
+
+def models_for(model: str) -> List[str]:
+    """Models to try for a request, in order"""
+    return MODEL_CHAIN if model == MODEL_CHAIN[0] else [model]
+
+
+def hedge_delay(model: str) -> float:
+    """Seconds to wait for model before asking the next one"""
+    observed = model_stats(model).quantile(LLM_HEDGE_QUANTILE)
+    return max(LLM_HEDGE_DEFAULT_DELAY if observed is None else observed, LLM_HEDGE_MIN_DELAY)
+
+
+def _can_fall_back(error: Exception) -> bool:
+    # A missing token (RuntimeError) fails every model alike
+    return not isinstance(error, RuntimeError)
+
+
+async def route(call: Callable[[str], Awaitable[T]], model: str,
+                discard: Optional[Callable[[T], Awaitable[object]]] = None) -> T:
+    """
+    Await call(model) with fallback and hedging along the model chain
+
+    Args:
+        call (callable): Sends the request to the given model
+        model (str): Requested model
+        discard (callable): Awaited with results that lost the race, e.g. to close an open stream
+
+    Returns:
+        The first successful result; the last error is raised when every model failed
+    """
+    models = models_for(model)
+    tasks: Dict["asyncio.Task", tuple] = {}  # task -> (model, start, hedged)
+    next_index = 0
+    last_error: Optional[Exception] = None
+
+    def launch(hedged: bool):
+        nonlocal next_index
+        name = models[next_index]
+        next_index += 1
+        model_stats(name).started(hedged)
+        tasks[asyncio.ensure_future(call(name))] = (name, time.monotonic(), hedged)
+
+    launch(False)
+    try:
+        while tasks:
+            # Only the most recently launched model is waited on for a hedge
+            newest_name, newest_start, _ = list(tasks.values())[-1]
+            timeout = None
+            if LLM_HEDGING and next_index < len(models):
+                timeout = max(hedge_delay(newest_name) - (time.monotonic() - newest_start), 0)
+            done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            if not done:
+                print(f"🔀 {newest_name} slower than {hedge_delay(newest_name):.1f}s, hedging with {models[next_index]}")
+                launch(True)
+                continue
+
+            for task in done:
+                name, start, hedged = tasks.pop(task)
+                error = task.exception()
+                if error is None:
+                    model_stats(name).succeeded(time.monotonic() - start, hedged)
+                    if name != model:
+                        print(f"🔀 Answer from {name} instead of {model}")
+                    for other in done - {task}:
+                        if other.exception() is None and discard is not None:
+                            await discard(other.result())
+                    return task.result()
+                model_stats(name).failed()
+                last_error = error
+                if not _can_fall_back(error):
+                    raise error
+                print(f"⚠️  {name} failed: {error}")
+
+            if not tasks and next_index < len(models):
+                launch(False)
+        raise last_error
+    finally:
+        for task, (name, start, _) in tasks.items():
+            task.cancel()
+            model_stats(name).abandoned(time.monotonic() - start)
+        if tasks:
+            # Let cancelled requests unwind; results that slipped through are discarded
+            for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+                if discard is not None and not isinstance(outcome, BaseException):
+                    await discard(outcome)
+
+
+def route_sync(call: Callable[[str], T], model: str) -> T:
+    """
+    call(model) along the model chain for blocking callers: fallback on error, no hedging
+
+    Returns:
+        The first successful result; the last error is raised when every model failed
+    """
+    last_error: Optional[Exception] = None
+    for name in models_for(model):
+        stats = model_stats(name)
+        stats.started()
+        start = time.monotonic()
+        try:
+            result = call(name)
+        except Exception as e:
+            stats.failed()
+            if not _can_fall_back(e):
+                raise
+            print(f"⚠️  {name} failed: {e}")
+            last_error = e
+            continue
+        stats.succeeded(time.monotonic() - start)
+        return result
+    raise last_error
@@ -4,21 +4,15 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import List, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from db.db_connection import get_db
 from models.news import News
-from newsFeeds import nagarik_news, nepal_news, ob_news, online_khabar, the_himalayan, rajdhani_daily, news_of_nepal
-import feedparser
-import ssl
+from newsFeeds.fetcher import fetch_sources
+from newsFeeds.registry import sources_for
+from service.news_store import insert_new_news, news_row
+from service.summarizer import summarize_and_store
 
-# Create a custom SSL context that doesn't verify certificates
-# This is needed for some RSS feeds that have SSL certificate issues
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
-
-# Configure feedparser to use the custom SSL context
-feedparser.PARSE_SSL_CONTEXT = ssl_context
+# Feeds are downloaded by newsFeeds.fetcher, which already skips certificate verification
+# for publishers with broken chains, so feedparser no longer needs a custom SSL context here
 
 
 class NepaliNewsService:
@@ -35,89 +29,13 @@ class NepaliNewsService:
         all_news = []
         
         try:
-            # Fetch English news
-            print("📡 Fetching English Nepali news...")
-            try:
-                ok_en = online_khabar.ok_en()
-                for item in ok_en:
-                    item['language'] = 'en'
-                    item['category'] = self.tag_en
-                all_news.extend(ok_en)
-                print(f"✓ Online Khabar English: {len(ok_en)} items")
-            except Exception as e:
-                print(f"✗ Error fetching Online Khabar English: {e}")
-            
-            try:
-                nepal_news_en = nepal_news.ok_en()
-                for item in nepal_news_en:
-                    item['language'] = 'en'
-                    item['category'] = self.tag_en
-                all_news.extend(nepal_news_en)
-                print(f"✓ Nepal News English: {len(nepal_news_en)} items")
-            except Exception as e:
-                print(f"✗ Error fetching Nepal News English: {e}")
-            
-            try:
-                tht_en = the_himalayan.ok_en()
-                for item in tht_en:
-                    item['language'] = 'en'
-                    item['category'] = self.tag_en
-                all_news.extend(tht_en)
-                print(f"✓ The Himalayan Times English: {len(tht_en)} items")
-            except Exception as e:
-                print(f"✗ Error fetching The Himalayan Times English: {e}")
-            
-            # Fetch Nepali news
-            print("📡 Fetching Nepali language news...")
-            try:
-                ok_np = online_khabar.ok_np()
-                for item in ok_np:
-                    item['language'] = 'np'
-                    item['category'] = self.tag_np
-                all_news.extend(ok_np)
-                print(f"✓ Online Khabar Nepali: {len(ok_np)} items")
-            except Exception as e:
-                print(f"✗ Error fetching Online Khabar Nepali: {e}")
-            
-            try:
-                ob_np = ob_news.ob_news_np()
-                for item in ob_np:
-                    item['language'] = 'np'
-                    item['category'] = self.tag_np
-                all_news.extend(ob_np)
-                print(f"✓ OB News Nepali: {len(ob_np)} items")
-            except Exception as e:
-                print(f"✗ Error fetching OB News Nepali: {e}")
-            
-            try:
-                nagarik_np = nagarik_news.nagarik_np()
-                for item in nagarik_np:
-                    item['language'] = 'np'
-                    item['category'] = self.tag_np
-                all_news.extend(nagarik_np)
-                print(f"✓ Nagarik News Nepali: {len(nagarik_np)} items")
-            except Exception as e:
-                print(f"✗ Error fetching Nagarik News Nepali: {e}")
-            
-            try:
-                rajdhani_np = rajdhani_daily.rd_np()
-                for item in rajdhani_np:
-                    item['language'] = 'np'
-                    item['category'] = self.tag_np
-                all_news.extend(rajdhani_np)
-                print(f"✓ Rajdhani Daily Nepali: {len(rajdhani_np)} items")
-            except Exception as e:
-                print(f"✗ Error fetching Rajdhani Daily Nepali: {e}")
-            
-            try:
-                news_of_nepal_np = news_of_nepal.non_np()
-                for item in news_of_nepal_np:
-                    item['language'] = 'np'
-                    item['category'] = self.tag_np
-                all_news.extend(news_of_nepal_np)
-                print(f"✓ News of Nepal Nepali: {len(news_of_nepal_np)} items")
-            except Exception as e:
-                print(f"✗ Error fetching News of Nepal Nepali: {e}")
+            # English and Nepali feeds are all downloaded in one concurrent batch
+            print("📡 Fetching English and Nepali language news...")
+            for spec, news_items in fetch_sources(sources_for("nepali_en", "nepali_np")):
+                for item in news_items:
+                    item['language'] = spec.language
+                    item['category'] = self.tag_en if spec.language == 'en' else self.tag_np
+                all_news.extend(news_items)
             
             print(f"📊 Total Nepali news items fetched: {len(all_news)}")
             return all_news
@@ -129,74 +47,21 @@ class NepaliNewsService:
     def save_news_to_db(self, news_items: List[Dict[str, Any]], db: Session) -> List[News]:
         """
         Save news items to database
-        Returns list of saved News objects
+        Existing articles are skipped by the (tag, link_hash) unique constraint
+        Returns list of newly saved News objects
         """
-        saved_news = []
-        
+        rows = []
         for news_item in news_items:
-            try:
-                # Determine tag based on language
-                language = news_item.get('language', 'en')
-                tag = self.tag_en if language == 'en' else self.tag_np
-                
-                # Check if news already exists (based on title and link)
-                existing_news = db.query(News).filter(
-                    and_(
-                        News.title == news_item.get('title'),
-                        News.link == news_item.get('link'),
-                        News.tag == tag
-                    )
-                ).first()
-                
-                if existing_news:
-                    print(f"⚠️  Nepali news already exists: {news_item.get('title')[:50]}...")
-                    continue
-                
-                # Save the raw publication date as string
-                pub_date = news_item.get('pubDate')
-                if pub_date:
-                    print(f"📅 Raw date: {pub_date}")
-                else:
-                    print(f"⚠️  No date found")
-                
-                # Create new news record
-                db_news = News(
-                    title=news_item.get('title', ''),
-                    description=news_item.get('description'),
-                    content=news_item.get('content'),
-                    link=news_item.get('link'),
-                    pub_date=pub_date,
-                    category=news_item.get('category'),
-                    image=news_item.get('image'),
-                    publisher=news_item.get('publisher'),
-                    tag=tag,
-                    summary=None,
-                    is_summarized=False
-                )
-                
-                db.add(db_news)
-                saved_news.append(db_news)
-                print(f"✓ Saved Nepali news ({language}): {news_item.get('title')[:50]}...")
-                
-            except Exception as e:
-                print(f"✗ Error saving news item: {e}")
-                continue
-        
-        # Commit all changes
-        try:
-            db.commit()
-            print(f"✓ Successfully saved {len(saved_news)} new Nepali news items to database")
-        except Exception as e:
-            db.rollback()
-            print(f"✗ Error committing to database: {e}")
-            return []
-        
-        return saved_news
+            # Determine tag based on language
+            language = news_item.get('language', 'en')
+            tag = self.tag_en if language == 'en' else self.tag_np
+            rows.append(news_row(news_item, tag))
+        return insert_new_news(rows, db, label="Nepali news")
     
     def process_nepali_news(self) -> Dict[str, Any]:
         """
         Main method to process Nepali news
-        Fetches news from all sources and saves to database
+        Fetches news from all sources, saves to database and summarizes the new articles
         """
         print("🇳🇵 Starting Nepali News Processing")
         print("=" * 50)
@@ -222,6 +87,10 @@ class NepaliNewsService:
             print("\n💾 Step 2: Saving Nepali news to database...")
             saved_news = self.save_news_to_db(news_items, db)
             
+            # Step 3: Summarize news
+            print("\n🤖 Step 3: Summarizing Nepali news using LLM...")
+            summarized_count = summarize_and_store(saved_news, db, label="Nepali news")
+            
             # Get total news count for both tags
             total_np_count = db.query(News).filter(News.tag == self.tag_np).count()
             total_en_count = db.query(News).filter(News.tag == self.tag_en).count()
@@ -231,6 +100,7 @@ class NepaliNewsService:
                 "message": "Nepali news processing completed successfully",
                 "fetched": len(news_items),
                 "saved": len(saved_news),
+                "summarized": summarized_count,
                 "total_in_database": {
                     "nepaliNewsNp": total_np_count,
                     "nepaliNewsEn": total_en_count
@@ -250,6 +120,7 @@ class NepaliNewsService:
                 "message": f"Error processing Nepali news: {str(e)}",
                 "fetched": 0,
                 "saved": 0,
+                "summarized": 0,
                 "total_in_database": 0
             }
         
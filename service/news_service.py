@@ -1,11 +1,42 @@
-from newsFeeds import nagarik_news, nepal_news, ob_news, online_khabar, the_himalayan, rajdhani_daily, news_of_nepal
+from newsFeeds.fetcher import fetch_sources
+from newsFeeds.dates import pub_date_sort_key
+from newsFeeds.registry import sources_for
 from fastapi import HTTPException
-import time
+from service.international_news_service import InternationalNewsService
+from service.sports_news_service import SportsNewsService
+from service.tech_news_service import TechNewsService
+from service import fast_json
+from service.http_cache import body_etag, make_etag
+from service.snapshot import SnapshotStore
+from service.ttl_cache import TTLCache
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Union
+import os
 import random
-from datetime import datetime
+import time
+
+# Nepali feed payloads per language: fresh for NEWS_CACHE_TTL seconds, then served stale for up
+# to NEWS_CACHE_STALE_TTL more seconds while a single background refresh replaces them
+CACHE_EXPIRY_TIME = int(os.getenv("NEWS_CACHE_TTL", "7200"))
+CACHE_STALE_TIME = int(os.getenv("NEWS_CACHE_STALE_TTL", "86400"))
+cache = TTLCache(maxsize=8, ttl=CACHE_EXPIRY_TIME, stale_ttl=CACHE_STALE_TIME, name="news cache")
+
+# Live international/sports/tech payloads, refreshed more often because they change faster
+LIVE_CACHE_EXPIRY_TIME = int(os.getenv("LIVE_NEWS_CACHE_TTL", "300"))
+LIVE_CACHE_STALE_TIME = int(os.getenv("LIVE_NEWS_CACHE_STALE_TTL", "3600"))
+live_cache = TTLCache(maxsize=8, ttl=LIVE_CACHE_EXPIRY_TIME, stale_ttl=LIVE_CACHE_STALE_TIME, name="live news cache")
 
-cache = {}
-CACHE_EXPIRY_TIME = 7200
+# Snapshot mode for multi-worker deployments: when NEWS_SNAPSHOT_DIR is set, payloads are built by
+# one worker and shared with the others through memory-mapped files instead of the caches above
+NEWS_SNAPSHOT_DIR = os.getenv("NEWS_SNAPSHOT_DIR", "")
+snapshots = SnapshotStore(NEWS_SNAPSHOT_DIR, ttl=CACHE_EXPIRY_TIME, stale_ttl=CACHE_STALE_TIME) if NEWS_SNAPSHOT_DIR else None
+live_snapshots = SnapshotStore(NEWS_SNAPSHOT_DIR, ttl=LIVE_CACHE_EXPIRY_TIME,
+                               stale_ttl=LIVE_CACHE_STALE_TIME) if NEWS_SNAPSHOT_DIR else None
+
+_SOURCE_GROUPS = {
+    "en": "nepali_en",
+    "np": "nepali_np",
+}
 
 
 def truncate_content(content: str, word_limit: int = 150) -> str:
@@ -15,61 +46,124 @@ def truncate_content(content: str, word_limit: int = 150) -> str:
     return content
 
 
-def cache_news_result(language: str, data):
-    cache[language] = {
-        "data": data,
-        "expiry": time.time() + CACHE_EXPIRY_TIME
-    }
+def _load_news(language: str):
+    combined_news = []
+    for _, news_items in fetch_sources(sources_for(_SOURCE_GROUPS[language])):
+        combined_news.extend(news_items)
+    if not combined_news:
+        # Not cached, so the next request tries the feeds again
+        raise HTTPException(status_code=404, detail="No news found")
+    random.shuffle(combined_news)
+    combined_news.sort(key=pub_date_sort_key, reverse=True)
+    for news_item in combined_news:
+        if 'content' in news_item:
+            news_item['content'] = truncate_content(news_item['content'])
+    return combined_news
 
 
-def get_cached_news(language: str):
-    if language in cache:
-        cached_item = cache[language]
-        # Check if cache item has expired
-        if cached_item['expiry'] > time.time():
-            return cached_item['data']
-        else:
-            del cache[language]  # Cache expired, remove it
-    return None
+class NewsPayload:
+    """
+    A cached news list, stored encoded so hits are served without serializing anything
 
+    Args:
+        data (bytes | memoryview): JSON-encoded list of news item dicts; in snapshot mode a view
+            into the shared mapping
+        etag (str): Changes whenever the list does
+        built_at (float): Unix time the list was fetched
+    """
 
-def summarise_news(language: str = "en"):
-    cached_news = get_cached_news(language)
-    if cached_news:
-        return cached_news
-    combined_news = []
+    def __init__(self, data: Union[bytes, memoryview], etag: str, built_at: float):
+        self.data = data
+        self.etag = etag
+        self.built_at = built_at
+
+    @classmethod
+    def from_items(cls, items: List[Dict[str, Any]]) -> "NewsPayload":
+        # Encoded and hashed once per refresh; the bytes are the same in every worker for the same list
+        data = fast_json.dumps(items)
+        return cls(data, body_etag(data), time.time())
+
+    @classmethod
+    def from_snapshot(cls, key: str, data: memoryview, built_at: float) -> "NewsPayload":
+        # All workers map the same file, so its build time and size identify the version
+        return cls(data, make_etag(key, built_at, len(data)), built_at)
+
+    @property
+    def age(self) -> float:
+        return max(time.time() - self.built_at, 0.0)
+
+    @property
+    def last_modified(self) -> datetime:
+        return datetime.fromtimestamp(self.built_at, tz=timezone.utc)
+
+    def body(self, include_age: bool = False) -> bytes:
+        """The {"status": "success", "data": [...]} response body, written around the encoded list"""
+        # One join: the list is copied once, straight from the snapshot mapping into the body
+        suffix = b',"cache_age":' + str(round(self.age, 1)).encode("ascii") + b"}" if include_age else b"}"
+        return b"".join((b'{"status":"success","data":', self.data, suffix))
+
+
+def get_news_payload(language: str = "en") -> NewsPayload:
+    """Nepali feed news for a language, from the snapshot in snapshot mode, otherwise from cache"""
+    if language not in _SOURCE_GROUPS:
+        raise HTTPException(status_code=400, detail="Language not supported")
     try:
-        if language == "en":
-            ok_json = online_khabar.ok_en()
-            nepal_news_json = nepal_news.ok_en()
-            tht_json = the_himalayan.ok_en()
-            combined_news.extend(ok_json)
-            combined_news.extend(nepal_news_json)
-            combined_news.extend(tht_json)
-        elif language == "np":
-            ok_json = online_khabar.ok_np()
-            ob_json = ob_news.ob_news_np()
-            nagarik_json = nagarik_news.nagarik_np()
-            rj_d = rajdhani_daily.rd_np()
-            nfn = news_of_nepal.non_np()
-            combined_news.extend(ok_json)
-            combined_news.extend(ob_json)
-            combined_news.extend(nagarik_json)
-            combined_news.extend(rj_d)
-            combined_news.extend(nfn)
-        else:
-            raise HTTPException(status_code=400, detail="Language not supported")
-        random.shuffle(combined_news)
-        combined_news.sort(key=lambda news: datetime.strptime(news["pubDate"], "%a, %d %b %Y %H:%M:%S %z"),
-                           reverse=True)
-        for news_item in combined_news:
-            if 'content' in news_item:
-                news_item['content'] = truncate_content(news_item['content'])
-
-        cache_news_result(language, combined_news)
-        return combined_news
+        if snapshots is not None:
+            key = f"news-{language}"
+            return NewsPayload.from_snapshot(key, *snapshots.get(key, lambda: fast_json.dumps(_load_news(language))))
+        return cache.get_or_load(language, lambda: NewsPayload.from_items(_load_news(language)))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error summarising news: {str(e)}")
 
-# combined_news_items = summarise_news(language="en")
-# print(json.dumps(combined_news_items, ensure_ascii=False, indent=4))
+
+def summarise_news(language: str = "en"):
+    return fast_json.loads(get_news_payload(language).data)
+
+
+def _load_international_news():
+    return InternationalNewsService().fetch_all_international_news()
+
+
+def _load_sports_news():
+    return SportsNewsService().fetch_all_sports_news()
+
+
+def _load_tech_news():
+    news = TechNewsService().fetch_all_tech_news()
+    # Sort news by pubDate descending; unparseable dates go last
+    news.sort(key=pub_date_sort_key, reverse=True)
+    return news
+
+
+_LIVE_LOADERS = {
+    "international": _load_international_news,
+    "sports": _load_sports_news,
+    "tech": _load_tech_news,
+}
+
+
+def get_live_news(category: str) -> NewsPayload:
+    """
+    Items fetched straight from the category's feeds, through live_cache or the live snapshot
+
+    Args:
+        category (str): "international", "sports" or "tech"
+
+    Returns:
+        NewsPayload
+    """
+    loader = _LIVE_LOADERS[category]
+
+    def load():
+        news = loader()
+        if not news:
+            # Not cached, so the next request tries the feeds again
+            raise HTTPException(status_code=404, detail=f"No {category} news found")
+        return news
+
+    if live_snapshots is not None:
+        key = f"live-{category}"
+        return NewsPayload.from_snapshot(key, *live_snapshots.get(key, lambda: fast_json.dumps(load())))
+    return live_cache.get_or_load(category, lambda: NewsPayload.from_items(load()))
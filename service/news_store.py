@@ -0,0 +1,82 @@
+"""
+Bulk news persistence
+A whole refresh is written with a few INSERT ... ON CONFLICT DO NOTHING RETURNING statements
+instead of one existence query per item. The (tag, link_hash) unique constraint decides what
+is a duplicate, so concurrent refreshes cannot insert the same article twice.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from models.news import News, news_link_hash
+from newsFeeds.dates import parse_pub_date
+
+# Rows per INSERT statement; keeps each statement well below PostgreSQL's bind parameter limit
+INSERT_CHUNK_SIZE = 500
+
+
+def news_row(news_item: Dict[str, Any], tag: str) -> Dict[str, Any]:
+    """Column values for a fetched news item"""
+    return {
+        "title": news_item.get('title', ''),
+        "description": news_item.get('description'),
+        "content": news_item.get('content'),
+        "link": news_item.get('link'),
+        "link_hash": news_link_hash(news_item.get('link'), news_item.get('title')),
+        "pub_date": news_item.get('pubDate'),
+        "published_at": parse_pub_date(news_item.get('pubDate')) or datetime.now(timezone.utc),
+        "category": news_item.get('category'),
+        "image": news_item.get('image'),
+        "publisher": news_item.get('publisher'),
+        "tag": tag,
+        "summary": None,
+        "is_summarized": False,
+    }
+
+
+def insert_new_news(rows: List[Dict[str, Any]], db: Session, label: str = "news") -> List[News]:
+    """
+    Insert rows, skipping any whose (tag, link_hash) is already stored
+
+    Args:
+        rows (list): Column dicts, see news_row
+        db (Session): Database session; committed on success, rolled back on failure
+        label (str): Used in log lines, e.g. "sports news"
+
+    Returns:
+        list: The News objects that were actually inserted
+    """
+    # Duplicates inside the batch itself (a feed listing an article twice) are dropped up front
+    seen = set()
+    unique_rows = []
+    for row in rows:
+        key = (row["tag"], row["link_hash"])
+        if key not in seen:
+            seen.add(key)
+            unique_rows.append(row)
+
+    saved_news: List[News] = []
+    try:
+        for start in range(0, len(unique_rows), INSERT_CHUNK_SIZE):
+            chunk = unique_rows[start:start + INSERT_CHUNK_SIZE]
+            statement = (
+                insert(News)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=[News.tag, News.link_hash])
+                .returning(News)
+            )
+            saved_news.extend(db.scalars(statement).all())
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error saving {label} to database: {e}")
+        return []
+
+    skipped = len(rows) - len(saved_news)
+    print(f"✓ Successfully saved {len(saved_news)} new {label} items to database")
+    if skipped:
+        print(f"⚠️  Skipped {skipped} {label} items that already exist")
+    return saved_news
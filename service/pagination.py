@@ -0,0 +1,117 @@
+"""
+Keyset (cursor) pagination for news lists
+Lists are ordered by (published_at DESC, id DESC). A cursor encodes the last row of a page,
+and the next page starts strictly after it, so Postgres seeks straight to it through the
+(tag, published_at DESC, id DESC) index instead of scanning and discarding earlier rows.
+Cursors are opaque to clients: URL-safe base64 of a small JSON document.
+"""
+
+import base64
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import func, select, tuple_
+
+from models.news import News
+
+# Response header carrying the cursor for endpoints whose body is a bare list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Largest page the list endpoints accept
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+
+# List name -> (last version seen, when this process first saw it)
+_version_seen: Dict[str, Tuple[tuple, datetime]] = {}
+_version_seen_lock = threading.Lock()
+
+
+def encode_cursor(news: News) -> str:
+    payload = json.dumps({"p": news.published_at.isoformat(), "i": news.id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["p"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(query, limit: int, offset: int = 0, cursor: Optional[str] = None):
+    """
+    Order a news query newest first and restrict it to one page
+
+    Args:
+        query: SQLAlchemy Query or Select over News, already filtered
+        limit (int): Page size, at least 1
+        offset (int): Rows to skip; only used without a cursor, kept for older clients
+        cursor (str): next_cursor from the previous page
+
+    Returns:
+        The query, fetching one extra row so next_page can tell whether another page exists
+    """
+    if cursor:
+        published_at, news_id = decode_cursor(cursor)
+        query = query.filter(tuple_(News.published_at, News.id) < tuple_(published_at, news_id))
+    query = query.order_by(News.published_at.desc(), News.id.desc())
+    if offset and not cursor:
+        query = query.offset(offset)
+    return query.limit(limit + 1)
+
+
+def next_page(rows: List[News], limit: int) -> Tuple[List[News], Optional[str]]:
+    """Split the rows of a paginate() query into the page and the cursor of the page after it"""
+    if len(rows) > limit:
+        page = rows[:limit]
+        return page, encode_cursor(page[-1])
+    return rows, None
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def list_version(*criteria):
+    """
+    Cheap version of a filtered news list, used as the ETag input of list endpoints
+
+    Inserts and deletes change the count or max(id); summaries written later change max(updated_at)
+
+    Returns:
+        Select of (count, max id, max updated_at)
+    """
+    return select(func.count(News.id), func.max(News.id), func.max(News.updated_at)).where(*criteria)
+
+
+def list_last_modified(name: str, version) -> datetime:
+    """
+    Last-Modified of a list: when this process first saw its current list_version
+
+    max(updated_at) alone misses deletes, which shrink the list without touching any remaining row;
+    any change to the version, the count included, moves this time forward. A version first seen
+    after a restart counts as new, which only costs clients one full response.
+
+    Args:
+        name (str): The list, without page parameters, e.g. "sports_news"
+        version: Row from list_version
+
+    Returns:
+        datetime (UTC)
+    """
+    version = tuple(version)
+    now = datetime.now(timezone.utc)
+    with _version_seen_lock:
+        seen = _version_seen.get(name)
+        if seen is None or seen[0] != version:
+            # HTTP dates have one-second resolution; a change within the second of the previous
+            # version must still produce a later date
+            changed_at = max(now, seen[1] + timedelta(seconds=1)) if seen else now
+            seen = _version_seen[name] = (version, changed_at)
+        return seen[1]
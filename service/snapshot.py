@@ -0,0 +1,169 @@
+"""
+Cross-worker snapshot cache
+With several uvicorn workers, each process would otherwise fetch and hold its own copy of the
+same feed payloads. In snapshot mode one process builds the encoded payload and publishes it
+atomically (write to a temp file, then os.replace) as a file that every worker memory-maps,
+so the bytes live once in the page cache and upstream fetches do not grow with the worker count.
+
+Who builds is decided with an exclusive flock per key: the winner rebuilds, the others keep
+serving the current snapshot, or wait for the winner when there is none yet. POSIX only.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+# File layout: magic, build time (unix seconds, double), payload length, payload bytes
+_MAGIC = b"NEWSSNP1"
+_HEADER = struct.Struct("<8sdQ")
+
+
+class _Mapping:
+    def __init__(self, inode: int, mapped: mmap.mmap, built_at: float, length: int):
+        self.inode = inode
+        self.mapped = mapped
+        self.built_at = built_at
+        self.length = length
+
+    def payload(self) -> memoryview:
+        # A view into the shared mapping, not a copy; the view keeps the mapping alive
+        return memoryview(self.mapped)[_HEADER.size:_HEADER.size + self.length]
+
+    def age(self) -> float:
+        return max(time.time() - self.built_at, 0.0)
+
+
+class SnapshotStore:
+    """
+    Memory-mapped snapshots shared by all worker processes
+
+    Args:
+        directory (str): Where snapshot and lock files live; must be shared by the workers
+        ttl (float): Seconds a snapshot is fresh
+        stale_ttl (float): Extra seconds a snapshot is served while one process rebuilds it
+    """
+
+    def __init__(self, directory: str, ttl: float, stale_ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._mappings: Dict[str, _Mapping] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.snap")
+
+    def _map(self, key: str) -> Optional[_Mapping]:
+        """Current snapshot for key, remapping when another process has replaced the file"""
+        path = self._path(key)
+        try:
+            inode = os.stat(path).st_ino
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            mapping = self._mappings.get(key)
+            if mapping is not None and mapping.inode == inode:
+                return mapping
+
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                inode = os.fstat(f.fileno()).st_ino
+        except (FileNotFoundError, ValueError):
+            return None
+        magic, built_at, length = _HEADER.unpack_from(mapped, 0) if len(mapped) >= _HEADER.size else (None, 0, 0)
+        if magic != _MAGIC or len(mapped) < _HEADER.size + length:
+            mapped.close()
+            return None
+
+        mapping = _Mapping(inode, mapped, built_at, length)
+        with self._lock:
+            # The previous mapping is released once no request is still slicing it
+            self._mappings[key] = mapping
+        return mapping
+
+    def _publish(self, key: str, payload: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            # mkstemp creates the file private to its owner; workers may run as other users
+            os.fchmod(fd, 0o644)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, time.time(), len(payload)))
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _build_locked(self, key: str, build: Callable[[], bytes], blocking: bool) -> bool:
+        """Rebuild key while holding its file lock; returns False when another process holds it"""
+        import fcntl
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{key}.lock"), "a+b") as lock_file:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                return False
+            try:
+                # Another process may have published while we waited for the lock
+                mapping = self._map(key)
+                if mapping is not None and mapping.age() < self.ttl:
+                    return True
+                self._publish(key, build())
+                return True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _refresh_in_background(self, key: str, build: Callable[[], bytes]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._build_locked(key, build, blocking=False)
+            except Exception as e:
+                print(f"✗ Snapshot refresh of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"snapshot-{key}", daemon=True).start()
+
+    def get(self, key: str, build: Callable[[], bytes]) -> Tuple[memoryview, float]:
+        """
+        Snapshot payload for key, building it when no usable snapshot exists
+
+        Args:
+            key (str): Snapshot name, used in the file name
+            build (callable): Returns the encoded payload; exceptions propagate and nothing is published
+
+        Returns:
+            tuple: (read-only view of the payload in the mapping, unix time the snapshot was built)
+        """
+        mapping = self._map(key)
+        if mapping is not None:
+            age = mapping.age()
+            if age < self.ttl:
+                return mapping.payload(), mapping.built_at
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(key, build)
+                return mapping.payload(), mapping.built_at
+
+        self._build_locked(key, build, blocking=True)
+        mapping = self._map(key)
+        if mapping is None:
+            raise RuntimeError(f"Snapshot {key} was not published")
+        return mapping.payload(), mapping.built_at
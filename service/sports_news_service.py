@@ -2,11 +2,13 @@ import asyncio
 from typing import List, Dict, Any
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
 from db.db_connection import get_db
 from models.news import News
-from newsFeeds.international_sports_news import the_hindu_sports, the_himalayan_times_sports
+from newsFeeds.fetcher import fetch_sources
+from newsFeeds.registry import sources_for
+from service.news_store import insert_new_news, news_row
+from service.summarizer import summarize_and_store
 
 
 class SportsNewsService:
@@ -20,26 +22,10 @@ class SportsNewsService:
         Returns a list of all news items from different sources
         """
         all_news = []
-        
-        try:
-            # Fetch from The Hindu Sports
-            print("Fetching The Hindu Sports News...")
-            hindu_sports_items = the_hindu_sports()
-            all_news.extend(hindu_sports_items)
-            print(f"✓ Fetched {len(hindu_sports_items)} The Hindu Sports items")
-            
-        except Exception as e:
-            print(f"✗ Error fetching The Hindu Sports News: {e}")
-        
-        try:
-            # Fetch from The Himalayan Times Sports
-            print("Fetching The Himalayan Times Sports News...")
-            himalayan_sports_items = the_himalayan_times_sports()
-            all_news.extend(himalayan_sports_items)
-            print(f"✓ Fetched {len(himalayan_sports_items)} The Himalayan Times Sports items")
-            
-        except Exception as e:
-            print(f"✗ Error fetching The Himalayan Times Sports News: {e}")
+
+        print("Fetching sports news from all sources...")
+        for _, news_items in fetch_sources(sources_for("sports")):
+            all_news.extend(news_items)
         
         print(f"\n📊 Total sports news items fetched: {len(all_news)}")
         return all_news
@@ -47,69 +33,15 @@ class SportsNewsService:
     def save_news_to_db(self, news_items: List[Dict[str, Any]], db: Session) -> List[News]:
         """
         Save news items to database
-        Returns list of saved News objects
+        Existing articles are skipped by the (tag, link_hash) unique constraint
+        Returns list of newly saved News objects
         """
-        saved_news = []
-        
-        for news_item in news_items:
-            try:
-                # Check if news already exists (based on title and link)
-                existing_news = db.query(News).filter(
-                    and_(
-                        News.title == news_item.get('title'),
-                        News.link == news_item.get('link'),
-                        News.tag == self.tag
-                    )
-                ).first()
-                
-                if existing_news:
-                    print(f"⚠️  Sports news already exists: {news_item.get('title')[:50]}...")
-                    continue
-                
-                # Save the raw publication date as string
-                pub_date = news_item.get('pubDate')
-                if pub_date:
-                    print(f"📅 Raw date: {pub_date}")
-                else:
-                    print(f"⚠️  No date found")
-                
-                # Create new news record
-                db_news = News(
-                    title=news_item.get('title', ''),
-                    description=news_item.get('description'),
-                    content=news_item.get('content'),
-                    link=news_item.get('link'),
-                    pub_date=pub_date,
-                    category=news_item.get('category'),
-                    image=news_item.get('image'),
-                    publisher=news_item.get('publisher'),
-                    tag=self.tag,
-                    summary=None,
-                    is_summarized=False
-                )
-                
-                db.add(db_news)
-                saved_news.append(db_news)
-                print(f"✓ Saved sports news: {news_item.get('title')[:50]}...")
-                
-            except Exception as e:
-                print(f"✗ Error saving sports news item: {e}")
-                continue
-        
-        # Commit all changes
-        try:
-            db.commit()
-            print(f"✓ Successfully saved {len(saved_news)} new sports news items to database")
-        except Exception as e:
-            db.rollback()
-            print(f"✗ Error committing to database: {e}")
-            return []
-        
-        return saved_news
+        rows = [news_row(news_item, self.tag) for news_item in news_items]
+        return insert_new_news(rows, db, label="sports news")
     
     def process_sports_news(self) -> Dict[str, Any]:
         """
-        Main method to fetch and save all sports news
+        Main method to fetch, save, and summarize all sports news
         Returns summary of the operation
         """
         print("⚽ Starting Sports News Processing...")
@@ -136,6 +68,10 @@ class SportsNewsService:
             print("\n💾 Step 2: Saving sports news to database...")
             saved_news = self.save_news_to_db(news_items, db)
             
+            # Step 3: Summarize news
+            print("\n🤖 Step 3: Summarizing sports news using LLM...")
+            summarized_count = summarize_and_store(saved_news, db, label="sports news")
+            
             # Get total news count for this tag
             total_news_count = db.query(News).filter(News.tag == self.tag).count()
             
@@ -144,6 +80,7 @@ class SportsNewsService:
                 "message": "Sports news processing completed successfully",
                 "fetched": len(news_items),
                 "saved": len(saved_news),
+                "summarized": summarized_count,
                 "total_in_database": total_news_count
             }
             
@@ -160,6 +97,7 @@ class SportsNewsService:
                 "message": f"Error processing sports news: {str(e)}",
                 "fetched": 0,
                 "saved": 0,
+                "summarized": 0,
                 "total_in_database": 0
             }
         
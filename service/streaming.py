@@ -0,0 +1,91 @@
+"""
+Streaming LLM responses
+Tokens are forwarded to the client as the model produces them, so the first bytes arrive after
+the model's first-token latency instead of after the whole completion. Two wire formats:
+
+- "sse" (text/event-stream): `event: token` with {"text": ...} per delta, then `event: done`
+- "ndjson" (application/x-ndjson): {"type": "token", "text": ...} per line, then {"type": "done", ...}
+
+The done event carries the fields the non-streaming endpoint returns next to the text (word count,
+detected language, model). A failure after the stream has started is sent as an error event,
+because the status code has already gone out.
+"""
+
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from service import fast_json
+
+STREAM_FORMATS = {
+    "sse": "text/event-stream",
+    "ndjson": "application/x-ndjson",
+}
+
+# Keeps proxies (nginx) from buffering the stream
+_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def encode_event(stream_format: str, event: str, data: Dict) -> bytes:
+    if stream_format == "sse":
+        return b"event: " + event.encode("ascii") + b"\ndata: " + fast_json.dumps(data) + b"\n\n"
+    return fast_json.dumps({"type": event, **data}) + b"\n"
+
+
+async def stream_response(tokens: AsyncIterator[str], trailer: Callable[[str], Dict],
+                          stream_format: str = "sse",
+                          on_complete: Optional[Callable[[str], object]] = None) -> StreamingResponse:
+    """
+    Stream tokens followed by a done event
+
+    Args:
+        tokens: Async iterator of text deltas
+        trailer (callable): Builds the done event's fields from the full text
+        stream_format (str): "sse" or "ndjson"
+        on_complete (callable): Awaited with the full text once the stream finished normally
+
+    Returns:
+        StreamingResponse; errors before the first token raise HTTPException(500) instead
+    """
+    if stream_format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(STREAM_FORMATS)}")
+
+    # Wait for the first token here, so a failed request (no token, model down) is a normal error
+    # response rather than a 200 with an error event
+    try:
+        first = await tokens.__anext__()
+    except StopAsyncIteration:
+        first = ""
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def body():
+        parts = [first]
+        try:
+            if first:
+                yield encode_event(stream_format, "token", {"text": first})
+            async for token in tokens:
+                parts.append(token)
+                yield encode_event(stream_format, "token", {"text": token})
+        except Exception as e:
+            print(f"ERROR in stream: {e}")
+            yield encode_event(stream_format, "error", {"detail": str(e)})
+            return
+        finally:
+            # Also runs when the client disconnects, closing the upstream request
+            await tokens.aclose()
+        text = "".join(parts)
+        yield encode_event(stream_format, "done", trailer(text))
+        if on_complete is not None:
+            try:
+                await on_complete(text)
+            except Exception as e:
+                print(f"⚠️  Stream completion hook failed: {e}")
+
+    return StreamingResponse(body(), media_type=STREAM_FORMATS[stream_format], headers=_STREAM_HEADERS)
+
+
+async def single_chunk(text: str) -> AsyncIterator[str]:
+    """A complete text as a one-token stream, for results that are already known"""
+    yield text
@@ -0,0 +1,288 @@
+"""
+Concurrent summarization of stored news
+Each summary is one LLM round trip that spends nearly all of its time waiting on the network,
+so articles are summarized concurrently instead of one after another:
+
+- up to SUMMARY_BATCH_SIZE articles share one request, so the long system prompt is sent once per
+  batch; articles whose summary cannot be read back from the batch answer are summarized singly;
+- at most SUMMARY_CONCURRENCY calls are in flight at once;
+- a token bucket keeps the call rate under SUMMARY_RATE_PER_SEC (bursts up to SUMMARY_BURST);
+- failed calls are retried up to SUMMARY_MAX_RETRIES times with full-jitter exponential backoff,
+  unless the error is a client error that a retry cannot fix;
+- finished summaries are committed every SUMMARY_COMMIT_EVERY articles, so a crash or a slow
+  tail does not hold back the ones already written.
+
+Inputs already in the summary cache (service/summary_cache.py) are reused without a call;
+the rest are skipped when HF_TOKEN is not configured.
+"""
+
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect, select, update
+from sqlalchemy.orm import Session
+
+from models.news import News
+from service.condense import estimate_tokens, token_budget
+from service.llm_service import DEFAULT_MODEL, asummarize_news_batch, close_async_clients
+from service.summary_cache import asummarize_cached, astore_summary, lookup_summaries, summary_key
+
+SUMMARY_CONCURRENCY = int(os.getenv("SUMMARY_CONCURRENCY", "8"))
+SUMMARY_RATE_PER_SEC = float(os.getenv("SUMMARY_RATE_PER_SEC", "4"))
+SUMMARY_BURST = int(os.getenv("SUMMARY_BURST", str(SUMMARY_CONCURRENCY)))
+SUMMARY_MAX_RETRIES = int(os.getenv("SUMMARY_MAX_RETRIES", "3"))
+SUMMARY_RETRY_BASE_DELAY = float(os.getenv("SUMMARY_RETRY_BASE_DELAY", "1.0"))
+SUMMARY_RETRY_MAX_DELAY = float(os.getenv("SUMMARY_RETRY_MAX_DELAY", "30"))
+SUMMARY_COMMIT_EVERY = int(os.getenv("SUMMARY_COMMIT_EVERY", "20"))
+# Articles packed into one request (1 disables batching), and the most estimated input tokens
+# of article text per request, counted after condensation (service/condense.py)
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "5"))
+SUMMARY_BATCH_MAX_TOKENS = int(os.getenv("SUMMARY_BATCH_MAX_TOKENS", "6000"))
+
+# (ids of the articles sharing the text, title for log lines, text to summarize)
+_Job = Tuple[List[int], str, str]
+
+
+class TokenBucket:
+    """
+    Async rate limiter: acquire() waits until a token is available
+
+    Args:
+        rate (float): Tokens added per second; 0 or less disables limiting
+        capacity (int): Most tokens that can accumulate, i.e. the largest burst
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        # Waiters are served one at a time, in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def summary_input(description: Optional[str], content: Optional[str]) -> str:
+    """Text sent to the summarizer: the description followed by the article content"""
+    text = ""
+    if description:
+        text += description + "\n\n"
+    if content:
+        text += content
+    return text
+
+
+def _is_retryable(error: Exception) -> bool:
+    # API errors carry an HTTP status; other exceptions are network failures and timeouts
+    status = getattr(error, "status_code", None)
+    if status is None:
+        return not isinstance(error, RuntimeError)
+    return status == 408 or status == 429 or status >= 500
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full jitter: uniform in [0, min(max delay, base * 2^attempt)]"""
+    return random.uniform(0, min(SUMMARY_RETRY_MAX_DELAY, SUMMARY_RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+async def _call_with_retries(call, description: str, semaphore: asyncio.Semaphore, bucket: TokenBucket):
+    """Await call() under the rate limit and the concurrency cap, retrying transient errors"""
+    for attempt in range(SUMMARY_MAX_RETRIES + 1):
+        await bucket.acquire()
+        try:
+            async with semaphore:
+                return await call()
+        except Exception as e:
+            if attempt >= SUMMARY_MAX_RETRIES or not _is_retryable(e):
+                raise
+            delay = backoff_delay(attempt)
+            print(f"🔄 Retrying {description} in {delay:.1f}s (attempt {attempt + 2}): {e}")
+            await asyncio.sleep(delay)
+
+
+async def _summarize_one(job: _Job, semaphore: asyncio.Semaphore,
+                         bucket: TokenBucket) -> List[Tuple[int, Optional[str]]]:
+    news_ids, title, text = job
+    try:
+        summary = await _call_with_retries(lambda: asummarize_cached(text), f"news item {news_ids[0]}",
+                                           semaphore, bucket)
+        print(f"✓ Summarized: {title[:50]}...")
+    except Exception as e:
+        print(f"✗ Error summarizing news item {news_ids[0]}: {e}")
+        summary = None
+    return [(news_id, summary) for news_id in news_ids]
+
+
+async def _summarize_batch(batch: List[_Job], semaphore: asyncio.Semaphore,
+                           bucket: TokenBucket) -> List[Tuple[int, Optional[str]]]:
+    """One request for the whole batch; articles it does not cover are summarized on their own"""
+    if len(batch) == 1:
+        return await _summarize_one(batch[0], semaphore, bucket)
+
+    try:
+        summaries = await _call_with_retries(lambda: asummarize_news_batch([text for _, _, text in batch]),
+                                             f"batch of {len(batch)}", semaphore, bucket)
+    except Exception as e:
+        print(f"⚠️  Batch of {len(batch)} failed, summarizing one by one: {e}")
+        summaries = [None] * len(batch)
+
+    results: List[Tuple[int, Optional[str]]] = []
+    missing = []
+    for job, summary in zip(batch, summaries):
+        if summary is None:
+            missing.append(job)
+            continue
+        await astore_summary(job[2], DEFAULT_MODEL, summary)
+        print(f"✓ Summarized: {job[1][:50]}...")
+        results.extend((news_id, summary) for news_id in job[0])
+
+    if missing:
+        if len(missing) < len(batch):
+            print(f"⚠️  Batch output had no summary for {len(missing)} of {len(batch)} articles, retrying singly")
+        for single in await asyncio.gather(*(_summarize_one(job, semaphore, bucket) for job in missing)):
+            results.extend(single)
+    return results
+
+
+def _make_batches(jobs: List[_Job]) -> List[List[_Job]]:
+    batches: List[List[_Job]] = []
+    current: List[_Job] = []
+    current_tokens = 0
+    budget = token_budget(DEFAULT_MODEL)
+    for job in jobs:
+        # Condensation caps every article at the model's budget before it is packed
+        tokens = min(estimate_tokens(job[2]), budget)
+        if current and (len(current) >= SUMMARY_BATCH_SIZE or current_tokens + tokens > SUMMARY_BATCH_MAX_TOKENS):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(job)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _commit_summaries(db: Session, summaries: Dict[int, str], label: str) -> int:
+    if not summaries:
+        return 0
+    now = datetime.utcnow()
+    try:
+        db.execute(update(News), [
+            {"id": news_id, "summary": summary, "is_summarized": True, "updated_at": now}
+            for news_id, summary in summaries.items()
+        ])
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error committing {label} summaries to database: {e}")
+        return 0
+    return len(summaries)
+
+
+async def _summarize_all(jobs: List[_Job], db: Session, label: str) -> int:
+    semaphore = asyncio.Semaphore(SUMMARY_CONCURRENCY)
+    bucket = TokenBucket(SUMMARY_RATE_PER_SEC, SUMMARY_BURST)
+    summarized_count = 0
+    pending: Dict[int, str] = {}
+
+    tasks = [asyncio.ensure_future(_summarize_batch(batch, semaphore, bucket)) for batch in _make_batches(jobs)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            for news_id, summary in await finished:
+                if summary:
+                    pending[news_id] = summary
+            if len(pending) >= SUMMARY_COMMIT_EVERY:
+                summarized_count += _commit_summaries(db, pending, label)
+                pending = {}
+        summarized_count += _commit_summaries(db, pending, label)
+    finally:
+        # The pool runs on its own event loop, whose LLM connections end with it
+        await close_async_clients()
+    return summarized_count
+
+
+def summarize_and_store(news_items: List[News], db: Session, label: str = "news") -> int:
+    """
+    Summarize news items concurrently and store the summaries
+
+    Args:
+        news_items (list): Stored News objects, e.g. those returned by insert_new_news
+        db (Session): Database session; summaries are committed in batches
+        label (str): Used in log lines, e.g. "sports news"
+
+    Returns:
+        int: Number of articles summarized and committed
+    """
+    if not news_items:
+        return 0
+
+    # The objects were expired by the insert's commit; their ids come from the identity map, and
+    # the text is read with one query instead of a refresh per object
+    ids = [inspect(news_item).identity[0] for news_item in news_items]
+    rows = db.execute(
+        select(News.id, News.title, News.description, News.content)
+        .where(News.id.in_(ids), News.is_summarized == False)
+    ).all()
+    # Articles with the same text (one story under several tags) share one summary
+    groups: Dict[str, _Job] = {}
+    for news_id, title, description, content in rows:
+        text = summary_input(description, content)
+        if not text.strip():
+            print(f"⚠️  No content to summarize for: {(title or '')[:50]}...")
+            continue
+        key = summary_key(text)
+        if key in groups:
+            groups[key][0].append(news_id)
+        else:
+            groups[key] = ([news_id], title or "", text)
+    jobs = list(groups.values())
+    if not jobs:
+        return 0
+
+    # Stories already summarized under another tag or publisher are copied without an LLM call
+    cached = lookup_summaries([text for _, _, text in jobs])
+    reused_count = _commit_summaries(
+        db, {news_id: cached[text] for news_ids, _, text in jobs if text in cached for news_id in news_ids}, label
+    )
+    if reused_count:
+        print(f"♻️  Reused {reused_count} cached {label} summaries")
+    jobs = [job for job in jobs if job[2] not in cached]
+    if not jobs:
+        return reused_count
+    if not os.getenv("HF_TOKEN"):
+        print(f"⚠️  HF_TOKEN not set, skipping {label} summarization")
+        return reused_count
+
+    article_count = sum(len(news_ids) for news_ids, _, _ in jobs)
+    print(f"🤖 Summarizing {article_count} {label} items ({len(jobs)} distinct texts, up to "
+          f"{SUMMARY_BATCH_SIZE} per request, {SUMMARY_CONCURRENCY} requests at a time, {SUMMARY_RATE_PER_SEC:g}/s)...")
+    start = time.perf_counter()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        summarized_count = asyncio.run(_summarize_all(jobs, db, label))
+    else:
+        # Async callers should call this through asyncio.to_thread; otherwise the caller's loop
+        # waits here for the whole run while the pool runs on its own loop
+        print(f"⚠️  summarize_and_store called on a running event loop; it is blocked until {label} summaries finish")
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            summarized_count = runner.submit(asyncio.run, _summarize_all(jobs, db, label)).result()
+    print(f"⏱  Summarized {summarized_count}/{article_count} {label} items in {time.perf_counter() - start:.1f}s")
+    return reused_count + summarized_count
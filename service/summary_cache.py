@@ -0,0 +1,176 @@
+"""
+Content-addressed summary cache
+The same wire story is often published by several outlets or stored under several tags, and
+ad-hoc /ai/summarize calls repeat article text too. Summaries are therefore stored by a hash of
+the normalized input text and the model, in the summary_cache table behind an in-memory LRU:
+
+- a hit in memory costs nothing; a hit in the table costs one primary-key lookup;
+- on a miss exactly one caller per key calls the LLM (concurrent callers wait for it), and the
+  result is written to the table for every worker and later ingest.
+
+Cache storage problems never fail a summary: the table is skipped and the LLM is called.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from db.db_connection import SessionLocal
+from models.summary_cache import SummaryCache
+from service.llm_service import DEFAULT_MODEL, asummarize_news, summarize_news
+from service.ttl_cache import TTLCache
+
+SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "2048"))
+# Summaries do not go stale; the TTL only lets idle entries leave memory
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "86400"))
+
+_memory = TTLCache(maxsize=SUMMARY_CACHE_SIZE, ttl=SUMMARY_CACHE_TTL, stale_ttl=0, name="summary cache")
+
+# Misses being loaded by async callers, per event loop (futures belong to the loop that made them)
+_async_inflight: Dict[Tuple[Any, str], "asyncio.Future"] = {}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of summary input: NFKC, whitespace runs collapsed, ends trimmed"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def summary_key(text: str, model: str = DEFAULT_MODEL) -> str:
+    """sha256 over the model and the normalized text"""
+    return hashlib.sha256(f"{model}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+def _load_stored(keys: List[str]) -> Dict[str, str]:
+    try:
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(SummaryCache.content_hash, SummaryCache.summary)
+                .where(SummaryCache.content_hash.in_(keys))
+            ).all()
+        return {content_hash: summary for content_hash, summary in rows}
+    except Exception as e:
+        print(f"⚠️  Summary cache lookup failed: {e}")
+        return {}
+
+
+def _store(key: str, model: str, summary: str):
+    try:
+        with SessionLocal() as db:
+            db.execute(
+                insert(SummaryCache)
+                .values(content_hash=key, model=model, summary=summary)
+                .on_conflict_do_nothing(index_elements=[SummaryCache.content_hash])
+            )
+            db.commit()
+    except Exception as e:
+        print(f"⚠️  Summary cache write failed: {e}")
+
+
+def summarize_cached(text: str, model: str = DEFAULT_MODEL) -> str:
+    """
+    summarize_news through the cache
+
+    Args:
+        text (str): Article text
+        model (str): Model identifier; part of the cache key
+
+    Returns:
+        str: The cached summary, or a new one from the LLM
+    """
+    key = summary_key(text, model)
+
+    def load() -> str:
+        stored = _load_stored([key]).get(key)
+        if stored is not None:
+            return stored
+        summary = summarize_news(text, model=model)
+        if summary:
+            _store(key, model, summary)
+        return summary
+
+    return _memory.get_or_load(key, load)
+
+
+async def aget_cached_summary(text: str, model: str = DEFAULT_MODEL) -> Optional[str]:
+    """Cached summary for text from memory or the table, or None; never calls the LLM"""
+    key = summary_key(text, model)
+    summary = _memory.peek(key)
+    if summary is None:
+        summary = (await asyncio.to_thread(_load_stored, [key])).get(key)
+        if summary is not None:
+            _memory.put(key, summary)
+    return summary
+
+
+async def astore_summary(text: str, model: str, summary: str):
+    """Cache a summary produced outside summarize_cached, e.g. a streamed one"""
+    key = summary_key(text, model)
+    await asyncio.to_thread(_store, key, model, summary)
+    _memory.put(key, summary)
+
+
+async def asummarize_cached(text: str, model: str = DEFAULT_MODEL) -> str:
+    """Async summarize_cached: the LLM call uses the shared AsyncOpenAI client"""
+    key = summary_key(text, model)
+    summary = _memory.peek(key)
+    if summary is not None:
+        return summary
+
+    loop = asyncio.get_running_loop()
+    flight = _async_inflight.get((loop, key))
+    if flight is not None:
+        return await asyncio.shield(flight)
+    flight = loop.create_future()
+    _async_inflight[(loop, key)] = flight
+    try:
+        summary = await aget_cached_summary(text, model)
+        if summary is None:
+            summary = await asummarize_news(text, model=model)
+            if summary:
+                await astore_summary(text, model, summary)
+        flight.set_result(summary)
+        return summary
+    except asyncio.CancelledError:
+        flight.cancel()
+        raise
+    except Exception as e:
+        flight.set_exception(e)
+        # Marks the exception as retrieved when no other caller was waiting
+        flight.exception()
+        raise
+    finally:
+        _async_inflight.pop((loop, key), None)
+
+
+def lookup_summaries(texts: List[str], model: str = DEFAULT_MODEL) -> Dict[str, str]:
+    """
+    Cached summaries for many inputs, with one table query for everything not in memory
+
+    Returns:
+        dict: Input text -> summary, for the inputs that have one
+    """
+    keys = {text: summary_key(text, model) for text in texts}
+    found: Dict[str, str] = {}
+    missing = []
+    for text, key in keys.items():
+        summary = _memory.peek(key)
+        if summary is not None:
+            found[text] = summary
+        else:
+            missing.append(key)
+
+    if missing:
+        stored = _load_stored(missing)
+        for text, key in keys.items():
+            if key in stored:
+                found[text] = stored[key]
+                _memory.put(key, stored[key])
+    return found
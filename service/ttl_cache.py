@@ -0,0 +1,151 @@
+"""
+Bounded TTL cache with single-flight loading and stale-while-revalidate
+Used for payloads that are expensive to build (every call refetches several feeds).
+
+- At most maxsize keys are kept; the least recently used key is evicted first.
+- A value is fresh for ttl seconds. After that it is served stale for up to stale_ttl more
+  seconds while one background refresh replaces it, so callers never wait on the refresh.
+- When there is nothing usable, exactly one caller runs the loader for a key; concurrent
+  callers for the same key wait for that result instead of loading it again.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Entry:
+    def __init__(self, value: Any, ttl: float):
+        self.value = value
+        self.stored_at = time.monotonic()
+        self.ttl = ttl
+
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class TTLCache:
+    """
+    Thread-safe keyed cache
+
+    Args:
+        maxsize (int): Maximum number of keys
+        ttl (float): Seconds a value stays fresh
+        stale_ttl (float): Extra seconds a value may be served while it is refreshed in the background
+        name (str): Used in log lines
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300, stale_ttl: float = 3600, name: str = "cache"):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Cached value for key, calling loader() when there is none"""
+        return self.get_or_load_with_age(key, loader, ttl)[0]
+
+    def get_or_load_with_age(self, key: Hashable, loader: Callable[[], Any],
+                             ttl: Optional[float] = None) -> Tuple[Any, float]:
+        """
+        Cached value for key together with its age
+
+        Args:
+            key: Cache key
+            loader (callable): Builds the value; exceptions propagate and nothing is cached
+            ttl (float): Overrides the cache-wide ttl for this key
+
+        Returns:
+            tuple: (value, seconds since the value was loaded)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = entry.age()
+                if age < entry.ttl:
+                    self._entries.move_to_end(key)
+                    return entry.value, age
+                if age < entry.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    if key not in self._inflight:
+                        self._inflight[key] = self._background().submit(self._refresh, key, loader, ttl)
+                    return entry.value, age
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            value = future.result()
+            return value, 0.0
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._store(key, value, ttl)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value, 0.0
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], ttl: float) -> Any:
+        try:
+            value = loader()
+        except Exception as e:
+            # Keep serving the stale value; the next stale hit retries
+            print(f"✗ {self.name}: background refresh of {key!r} failed: {e}")
+            with self._lock:
+                self._inflight.pop(key, None)
+            raise
+        with self._lock:
+            self._store(key, value, ttl)
+            self._inflight.pop(key, None)
+        return value
+
+    def _store(self, key: Hashable, value: Any, ttl: float):
+        self._entries[key] = _Entry(value, ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _background(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"{self.name}-refresh")
+        return self._executor
+
+    def peek(self, key: Hashable) -> Any:
+        """Fresh value for key, or None; never loads"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.age() >= entry.ttl:
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._store(key, value, self.ttl if ttl is None else ttl)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)